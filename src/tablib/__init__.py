@@ -19,4 +19,7 @@ from .core import (  # noqa: F401
     detect_format,
     import_book,
     import_set,
+    iter_import,
+    iter_rows,
+    unique_rows,
 )
@@ -9,16 +9,33 @@
 """
 
 __lazy_modules__ = {
-    "copy",
+    "array",
+    "bisect",
+    "collections",
+    "functools",
+    "itertools",
     "operator",
+    "os",
+    "pickle",
+    "sys",
     "tablib.exceptions",
     "tablib.utils",
+    "weakref",
 }
 
-from copy import copy
+from array import array
+from bisect import insort
+from collections import namedtuple
+from functools import partial
+from itertools import islice
 from operator import itemgetter
+from os import PathLike
+from pickle import PickleBuffer
+from sys import byteorder
+from weakref import WeakSet
 
 from .exceptions import (
+    DuplicateKey,
     HeadersNeeded,
     InvalidDatasetIndex,
     InvalidDatasetType,
@@ -34,6 +51,8 @@ __license__ = 'MIT'
 __copyright__ = 'Copyright 2017 Kenneth Reitz. 2019 Jazzband.'
 __docformat__ = 'restructuredtext'
 
+STORAGES = ('rows', 'columnar')
+
 
 class Row:
     """Internal Row object. Mainly used for filtering."""
@@ -44,6 +63,14 @@ class Row:
         self._row = list(row)
         self.tags = list(tags)
 
+    @classmethod
+    def adopt(cls, row, tags=()):
+        """Returns a :class:`Row` wrapping the given list without copying it."""
+        self = cls.__new__(cls)
+        self._row = row
+        self.tags = list(tags)
+        return self
+
     def __iter__(self):
         return (col for col in self._row)
 
@@ -99,12 +126,437 @@ class Row:
     def has_tag(self, tag):
         """Returns true if current row contains tag."""
 
+        return _match_tags(self.tags, tag)
+
+
+class BoolArray(array):
+    """Internal array of booleans, stored one byte each and read as bool."""
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return list(map(bool, super().__getitem__(key)))
+        return bool(super().__getitem__(key))
+
+    def __iter__(self):
+        return map(bool, super().__iter__())
+
+
+# Array type codes of the types of values typed columns can hold
+TYPECODES = {bool: 'b', float: 'd', int: 'q'}
+
+
+class CategoricalColumn:
+    """Internal dictionary-encoded column, keeping each distinct value once in
+    `categories` and the column itself as small integer codes into it."""
+
+    __slots__ = ['codes', 'categories', 'lookup']
+
+    def __init__(self, values=()):
+        self.codes = array('B')
+        self.categories = []
+        # {(type, value): code}, so that equal values of different types,
+        # such as 1 and True, keep distinct codes
+        self.lookup = {}
+        self.extend(values)
+
+    def _code(self, value):
+        key = (value.__class__, value)
+        code = self.lookup.get(key)
+        if code is None:
+            code = self.lookup[key] = len(self.categories)
+            self.categories.append(value)
+            if code in (1 << 8, 1 << 16):
+                self.codes = array('H' if code == 1 << 8 else 'I', self.codes)
+        return code
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        return map(self.categories.__getitem__, self.codes)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self.categories[code] for code in self.codes[key]]
+        return self.categories[self.codes[key]]
+
+    def __setitem__(self, key, value):
+        code = self._code(value)
+        self.codes[key] = code
+
+    def __delitem__(self, key):
+        del self.codes[key]
+
+    def append(self, value):
+        code = self._code(value)
+        self.codes.append(code)
+
+    def insert(self, index, value):
+        code = self._code(value)
+        self.codes.insert(index, code)
+
+    def extend(self, values):
+        codes = [self._code(value) for value in values]
+        self.codes.extend(codes)
+
+    def take(self, indexes):
+        """Returns a new column with the values at the given positions."""
+        column = CategoricalColumn()
+        codes = self.codes
+        column.codes = array(codes.typecode, [codes[i] for i in indexes])
+        column.categories = list(self.categories)
+        column.lookup = dict(self.lookup)
+        return column
+
+
+class LazyColumns(list):
+    """Internal list of columns, where a column can be left as a
+    :func:`functools.partial` returning it, only called on first access."""
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        column = super().__getitem__(key)
+        if isinstance(column, partial):
+            column = column()
+            super().__setitem__(key, column)
+        return column
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class ColumnStore:
+    """Internal column-oriented row container.
+
+    Keeps one list per column plus one tags tuple per row, while exposing the
+    subset of the list API :class:`Dataset` uses on its row storage. Rows are
+    materialized as :class:`Row` objects on access only.
+
+    A column holding only ``int``, ``float`` or ``bool`` values can be a typed
+    array instead of a list, and a column repeating few values can be
+    dictionary-encoded (see :meth:`Dataset.set_schema`). Such a column is
+    turned back into a list as soon as it is given a value it cannot hold.
+    """
+
+    __slots__ = ['columns', 'tags']
+
+    def __init__(self, rows=()):
+        self.columns = []
+        self.tags = []
+        self.extend(rows)
+
+    @classmethod
+    def from_columns(cls, columns, height):
+        """Returns a store adopting the given column lists without copying them."""
+        store = cls()
+        store.columns = columns
+        store.tags = [()] * height
+        return store
+
+    def __len__(self):
+        return len(self.tags)
+
+    def __iter__(self):
+        for values, tags in zip(self.values(), self.tags):
+            yield Row(values, tags)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        tags = self.tags[key]
+        return Row([col[key] for col in self.columns], tags)
+
+    def __setitem__(self, key, row):
+        tags = self.tags[key]
+        if len(row) != len(self.columns):
+            raise InvalidDimensions
+        for pos, value in enumerate(row):
+            self._column_for(pos, (value,))[key] = value
+        self.tags[key] = tuple(getattr(row, 'tags', tags))
+
+    def __delitem__(self, key):
+        del self.tags[key]
+        for col in self.columns:
+            del col[key]
+
+    @property
+    def width(self):
+        return len(self.columns)
+
+    def values(self):
+        """Yields each row as a tuple of cell values."""
+        if self.columns:
+            return zip(*self.columns)
+        return (() for _ in self.tags)
+
+    def insert(self, index, row, tags=None):
+        if tags is None:
+            tags = getattr(row, 'tags', ())
+        if not self.tags and len(self.columns) != len(row):
+            self.columns = [[] for _ in range(len(row))]
+        elif len(row) != len(self.columns):
+            raise InvalidDimensions
+        if index >= len(self.tags):
+            for pos, value in enumerate(row):
+                self._column_for(pos, (value,)).append(value)
+            self.tags.append(tuple(tags))
+        else:
+            for pos, value in enumerate(row):
+                self._column_for(pos, (value,)).insert(index, value)
+            self.tags.insert(index, tuple(tags))
+
+    def append(self, row, tags=None):
+        self.insert(len(self.tags), row, tags)
+
+    def extend(self, rows, tags=None):
+        rows = list(rows)
+        if not rows:
+            return
+        if not self.tags and len(self.columns) != len(rows[0]):
+            self.columns = [[] for _ in range(len(rows[0]))]
+        width = len(self.columns)
+        if any(len(row) != width for row in rows):
+            raise InvalidDimensions
+        for pos, values in enumerate(zip(*rows)):
+            self._column_for(pos, values).extend(values)
+        if tags is None:
+            self.tags.extend([tuple(getattr(row, 'tags', ())) for row in rows])
+        else:
+            self.tags.extend([tuple(tags)] * len(rows))
+
+    def get_col(self, index):
+        if not self.tags:
+            return []
+        return list(self.columns[index])
+
+    def take(self, indexes):
+        """Returns a new store with the rows at the given positions."""
+        store = ColumnStore.from_columns(
+            [
+                col.take(indexes) if isinstance(col, CategoricalColumn)
+                else _like(col, [col[i] for i in indexes])
+                for col in self.columns
+            ],
+            0,
+        )
+        store.tags = [self.tags[i] for i in indexes]
+        return store
+
+    def _column_for(self, pos, values):
+        """Returns the column at `pos`, turned back into a list if it is a
+        typed column which cannot hold `values`."""
+        col = self.columns[pos]
+        kind = _column_type(col)
+        if kind is not None and not _fits(kind, values):
+            col = self.columns[pos] = list(col)
+        return col
+
+    def insert_col(self, index, col):
+        self.columns.insert(index, list(col))
+
+    def del_col(self, index):
+        if self.tags or index < len(self.columns):
+            del self.columns[index]
+
+
+class RowsView:
+    """Internal read-only row container mapping rows of other containers.
+
+    Each segment is a ``(data, indexes)`` pair where ``data`` is the row
+    container of another :class:`Dataset` and ``indexes`` a range or list of
+    positions in it. If ``cols`` is set, only the values at those column
+    positions are exposed. A :class:`Dataset` holding a view replaces it with
+    a real container before being modified, and so do its parents.
+    """
+
+    __slots__ = ['segments', 'cols', '_project']
+
+    def __init__(self, segments, cols=None):
+        self.segments = segments
+        self.cols = cols
+        self._project = None if cols is None else _projection(cols)
+
+    def __len__(self):
+        return sum(len(indexes) for _, indexes in self.segments)
+
+    def __iter__(self):
+        for data, indexes in self.segments:
+            for i in indexes:
+                yield self._get(data, i)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+
+        index = key + len(self) if key < 0 else key
+        if index >= 0:
+            for data, indexes in self.segments:
+                if index < len(indexes):
+                    return self._get(data, indexes[index])
+                index -= len(indexes)
+        raise IndexError('list index out of range')
+
+    def _get(self, data, i):
+        if isinstance(data, ColumnStore):
+            if self.cols is None:
+                return Row([col[i] for col in data.columns], data.tags[i])
+            return Row([data.columns[pos][i] for pos in self.cols], data.tags[i])
+
+        row = data[i]
+        if self.cols is None:
+            return row
+        return Row.adopt(list(self._project(row._row)), row.tags)
+
+    def get_col(self, index):
+        pos = index if self.cols is None else self.cols[index]
+        values = []
+        for data, indexes in self.segments:
+            if isinstance(data, ColumnStore):
+                column = data.columns[pos]
+                if isinstance(indexes, range) and indexes.step == 1:
+                    values.extend(column[indexes.start:indexes.stop])
+                else:
+                    values.extend([column[i] for i in indexes])
+            else:
+                values.extend([data[i][pos] for i in indexes])
+        return values
+
+    def materialize(self, storage):
+        """Returns a container of the given storage owning a copy of the rows."""
+        if storage == 'columnar':
+            store = ColumnStore(self)
+            for index, kind in enumerate(self.column_types()):
+                if kind is not None:
+                    store.columns[index] = _typed_column(kind, store.columns[index])
+            return store
+        return [row.copy() for row in self]
+
+    def column_types(self):
+        """Returns, for each column, the type of its values if it is typed in
+        all the segments, or None."""
+        stores = [data for data, _ in self.segments if isinstance(data, ColumnStore)]
+        if not stores or len(stores) != len(self.segments):
+            return []
+        width = min(store.width for store in stores)
+        types = []
+        for pos in range(width) if self.cols is None else self.cols:
+            kinds = {_column_type(store.columns[pos]) if pos < width else None for store in stores}
+            types.append(kinds.pop() if len(kinds) == 1 else None)
+        return types
+
+
+class TagIndex:
+    """Internal inverted index of row tags, mapping each tag to the set of
+    positions of the rows carrying it."""
+
+    __slots__ = ['positions', 'height']
+
+    def __init__(self, rows_tags=()):
+        self.positions = {}
+        self.height = 0
+        for tags in rows_tags:
+            self.add(self.height, 1, tags)
+
+    def add(self, start, count, tags):
+        """Indexes `count` rows appended at position `start` with `tags`."""
+        for tag in tags:
+            self.positions.setdefault(tag, set()).update(range(start, start + count))
+        self.height = start + count
+
+    def remove_last(self, tags):
+        """Unindexes the last row, which carried `tags`."""
+        self.height -= 1
+        for tag in tags:
+            self.positions.get(tag, set()).discard(self.height)
+
+    def match(self, tag):
+        """Returns the positions of the rows carrying `tag`, or any of the
+        tags in `tag` if it is a collection."""
         if tag is None:
-            return False
+            return set()
         elif isinstance(tag, str):
-            return tag in self.tags
+            return set(self.positions.get(tag, ()))
+        return set().union(*(self.positions.get(t, ()) for t in tag))
+
+    def match_all(self, tags):
+        """Returns the positions of the rows carrying all the given tags."""
+        if isinstance(tags, str):
+            tags = [tags]
+        sets = sorted((self.positions.get(tag, set()) for tag in tags), key=len)
+        if not sets:
+            return set()
+        return sets[0].intersection(*sets[1:])
+
+
+class ColumnIndex:
+    """Internal hash index of the values of a column, mapping each value to
+    the ascending positions of the rows holding it.
+
+    Positions are stored shifted by `base`, so that rows can be added to or
+    removed from the top in constant time.
+    """
+
+    __slots__ = ['column', 'unique', 'pos', 'positions', 'base']
+
+    def __init__(self, column, unique=False):
+        self.column = column
+        self.unique = unique
+        self.pos = None
+        # Built on first use, see Dataset._column_index
+        self.positions = None
+        self.base = 0
+
+    def build(self, pos, values):
+        """Indexes `values`, the column at position `pos`."""
+        self.pos = pos
+        self.positions = {}
+        self.base = 0
+        try:
+            for i, value in enumerate(values):
+                self.add(i, value)
+        except DuplicateKey:
+            self.positions = None
+            raise
+
+    def add(self, i, value):
+        """Indexes `value` at the row position `i`."""
+        key = _hashable(value)
+        stored = i + self.base
+        found = self.positions.get(key)
+        if found is None:
+            self.positions[key] = [stored]
+        elif self.unique:
+            raise DuplicateKey(f'{value!r} is already in the index of {self.column!r}.')
+        elif stored > found[-1]:
+            found.append(stored)
         else:
-            return bool(len(set(tag) & set(self.tags)))
+            insort(found, stored)
+
+    def remove(self, i, value):
+        """Unindexes `value` at the row position `i`."""
+        key = _hashable(value)
+        found = self.positions[key]
+        found.remove(i + self.base)
+        if not found:
+            del self.positions[key]
+
+    def get(self, value):
+        """Returns the positions of the rows holding `value`."""
+        return [stored - self.base for stored in self.positions.get(_hashable(value), ())]
+
+    def check(self, values, replacing=None):
+        """Raises DuplicateKey if `values` repeat each other, or a value of a
+        row other than the one at position `replacing`."""
+        seen = set()
+        for value in values:
+            key = _hashable(value)
+            found = self.positions.get(key)
+            if key in seen or (
+                found and (replacing is None or found != [replacing + self.base])
+            ):
+                raise DuplicateKey(f'{value!r} is already in the index of {self.column!r}.')
+            seen.add(key)
 
 
 class Dataset:
@@ -144,6 +596,14 @@ class Dataset:
     :param \\*args: (optional) list of rows to populate Dataset
     :param headers: (optional) list strings for Dataset header row
     :param title: (optional) string to use as title of the Dataset
+    :param storage: (optional) ``'rows'`` (the default) to keep data as a list
+        of rows, or ``'columnar'`` to keep one list per column. Columnar
+        storage makes column operations cheap and avoids per-row objects.
+    :param cache_formatted: (optional) if ``True``, the result of applying the
+        :meth:`formatters <Dataset.add_formatter>` is kept and reused by
+        subsequent exports until the Dataset is modified.
+    :param schema: (optional) ``{column: type}`` dictionary of the columns to
+        store in typed arrays, see :meth:`Dataset.set_schema`.
 
 
     .. admonition:: Format Attributes Definition
@@ -155,9 +615,16 @@ class Dataset:
     """
 
     def __init__(self, *args, **kwargs):
-        self._data = [Row(arg) for arg in args]
+        self._storage = kwargs.get('storage', 'rows')
+        if self._storage not in STORAGES:
+            raise ValueError(f"Unknown storage '{self._storage}'.")
+
+        self._data = self._new_data(args)
         self.__headers = None
 
+        # {header: column position}
+        self._header_pos = {}
+
         # ('title', index) tuples
         self._separators = []
 
@@ -167,22 +634,89 @@ class Dataset:
         # {col_index: col_func}
         self._dynamic_columns = {}
 
+        # Formatted rows, kept between exports if cache_formatted is set
+        self.cache_formatted = kwargs.get('cache_formatted', False)
+        self._formatted = None
+
+        # Datasets reading rows from this one, see RowsView
+        self._views = None
+
+        # Built on first use by filter(), see TagIndex
+        self._tag_index = None
+
+        # {column: ColumnIndex}, see create_index()
+        self._indexes = {}
+
         self.headers = kwargs.get('headers')
 
         self.title = kwargs.get('title')
 
+        if kwargs.get('schema'):
+            self.set_schema(kwargs['schema'])
+
     def __len__(self):
         return self.height
 
+    def __iter__(self):
+        return map(tuple, self._iter_values())
+
+    @classmethod
+    def from_rows(cls, rows, headers=None, title=None, copy=True, storage='rows'):
+        """Returns a new :class:`Dataset` holding the given rows.
+
+        All rows are validated against the headers (or the first row) at once.
+        If ``copy`` is ``False``, rows which are lists are adopted as they are
+        rather than copied, so they must not be modified by the caller
+        afterwards. ``copy`` has no effect on columnar storage.
+        """
+
+        if not isinstance(rows, list):
+            rows = list(rows)
+
+        dset = cls(headers=headers, title=title, storage=storage)
+        width = dset.width or (len(rows[0]) if rows else 0)
+        if any(len(row) != width for row in rows):
+            raise InvalidDimensions
+
+        if dset._columnar:
+            dset._data.extend(rows)
+        elif copy:
+            dset._data = [Row(row) for row in rows]
+        else:
+            dset._data = [
+                Row.adopt(row if isinstance(row, list) else list(row)) for row in rows
+            ]
+        return dset
+
+    @classmethod
+    def from_columns(cls, columns, title=None, copy=True, storage='columnar'):
+        """Returns a new :class:`Dataset` from a ``{header: column}`` mapping.
+
+        All columns must have the same length. With the default columnar
+        storage and ``copy`` set to ``False``, columns which are lists are
+        adopted as they are rather than copied, so they must not be modified
+        by the caller afterwards.
+        """
+
+        headers = list(columns)
+        cols = list(columns.values())
+        height = len(cols[0]) if cols else 0
+        if any(len(col) != height for col in cols):
+            raise InvalidDimensions
+
+        dset = cls(headers=headers, title=title, storage=storage)
+        if dset._columnar:
+            dset._data = ColumnStore.from_columns(
+                [col if isinstance(col, list) and not copy else list(col) for col in cols],
+                height,
+            )
+        else:
+            dset._data = [Row.adopt(list(values)) for values in zip(*cols)]
+        return dset
+
     def __getitem__(self, key):
         if isinstance(key, str):
-            if self.headers is None:
-                raise HeadersNeeded()
-            if key in self.headers:
-                pos = self.headers.index(key)  # get 'key' index from each data
-                return [row[pos] for row in self._data]
-            else:
-                raise KeyError
+            return self.get_col(self._header_index(key))
         else:
             _results = self._data[key]
             if isinstance(_results, Row):
@@ -192,29 +726,118 @@ class Dataset:
 
     def __setitem__(self, key, value):
         self._validate(value)
+        pos = key + self.height if isinstance(key, int) and key < 0 else key
+        self._check_unique([value], replacing=pos)
+        self._before_write()
+        self._tag_index = None
+        old = self._data[key]
         self._data[key] = Row(value)
 
+        for col_index in self._indexes.values():
+            if col_index.positions is None:
+                continue
+            if isinstance(pos, int):
+                col_index.remove(pos, old[col_index.pos])
+                col_index.add(pos, value[col_index.pos])
+            else:
+                col_index.positions = None
+
     def __delitem__(self, key):
+        self._before_write()
         if isinstance(key, str):
-            if self.headers is None:
-                raise HeadersNeeded()
-
-            if key in self.headers:
-
-                pos = self.headers.index(key)
-                del self.headers[pos]
-                if pos in self._dynamic_columns:
-                    del self._dynamic_columns[pos]
+            pos = self._header_index(key)
+            del self.headers[pos]
+            self._index_headers()
+            self._indexes.pop(key, None)
+            self._reset_indexes()
+            if pos in self._dynamic_columns:
+                del self._dynamic_columns[pos]
+
+            if self._columnar:
+                self._data.del_col(pos)
+                return
 
-                for i, row in enumerate(self._data):
+            for i, row in enumerate(self._data):
 
-                    del row[pos]
-                    self._data[i] = row
-            else:
-                raise KeyError
+                del row[pos]
+                self._data[i] = row
         else:
+            height = self.height
+            pos = key + height if isinstance(key, int) and key < 0 else key
+            tag_index, self._tag_index = self._tag_index, None
+            if tag_index is not None and pos == height - 1:
+                if self._columnar:
+                    tag_index.remove_last(self._data.tags[key])
+                else:
+                    tag_index.remove_last(self._data[key].tags)
+                self._tag_index = tag_index
+
+            for col_index in self._indexes.values():
+                if col_index.positions is None:
+                    continue
+                if pos in (0, height - 1):
+                    col_index.remove(pos, self._data[key][col_index.pos])
+                    if pos == 0:
+                        col_index.base += 1
+                else:
+                    col_index.positions = None
             del self._data[key]
 
+    def __reduce_ex__(self, protocol):
+        # The table is pickled as one block per column rather than one Row
+        # object per row. With protocol 5, typed columns are passed as
+        # buffers, which can be sent out-of-band.
+        state = self.__dict__.copy()
+        del state['_data']
+        state['_formatted'] = None
+        state['_views'] = None
+        state['_tag_index'] = None
+        state['_indexes'] = {
+            column: ColumnIndex(column, col_index.unique)
+            for column, col_index in self._indexes.items()
+        }
+
+        data = self._data
+        if isinstance(data, RowsView):
+            data = data.materialize('columnar')
+        if isinstance(data, ColumnStore):
+            columns, tags = data.columns, data.tags
+        else:
+            columns = [list(col) for col in zip(*(row._row for row in data))]
+            tags = [row.tags for row in data]
+
+        blocks = [_column_block(col, protocol) for col in columns]
+        height = len(tags)
+        if not any(tags):
+            tags = None
+        return _restore_dataset, (self.__class__, state, blocks, tags, height, byteorder)
+
+    def __setstate__(self, state):
+        # Pickles of earlier versions only hold the attributes they had then.
+        self.__dict__.update(state)
+        defaults = {
+            '_storage': 'columnar' if isinstance(self._data, ColumnStore) else 'rows',
+            '_separators': [],
+            '_formatters': [],
+            '_dynamic_columns': {},
+            'cache_formatted': False,
+            '_formatted': None,
+            '_views': None,
+            '_tag_index': None,
+            '_indexes': {},
+            'title': None,
+        }
+        for name, value in defaults.items():
+            self.__dict__.setdefault(name, value)
+        self._index_headers()
+
+    def __copy__(self):
+        # Unlike pickled ones, the list blocks of __reduce_ex__() are the
+        # columns of a columnar Dataset themselves.
+        restore, (cls, state, blocks, tags, height, order) = self.__reduce_ex__(4)
+        blocks = [list(block) if isinstance(block, list) else block for block in blocks]
+        return restore(cls, state, blocks, tags, height, order)
+
     def __repr__(self):
         try:
             return f'<{self.title.lower()} dataset>'
@@ -246,6 +869,16 @@ class Dataset:
     # Internals
     # ---------
 
+    @property
+    def _columnar(self):
+        return isinstance(self._data, ColumnStore)
+
+    def _new_data(self, rows=()):
+        """Returns a new row container matching the storage of this Dataset."""
+        if self._storage == 'columnar':
+            return ColumnStore(rows)
+        return [row if isinstance(row, Row) else Row(row) for row in rows]
+
     def _get_in_format(self, fmt_key, **kwargs):
         return registry.get_format(fmt_key).export_set(self, **kwargs)
 
@@ -253,6 +886,30 @@ class Dataset:
         in_stream = normalize_input(in_stream)
         return registry.get_format(fmt_key).import_set(self, in_stream, **kwargs)
 
+    def _index_headers(self):
+        """Rebuilds the header to column position map."""
+        self._header_pos = {}
+        for pos, header in enumerate(self.__headers or ()):
+            try:
+                self._header_pos.setdefault(header, pos)
+            except TypeError:
+                # Unhashable headers can't be looked up by name anyway.
+                pass
+
+    def _header_index(self, key):
+        """Returns the column position of header `key`."""
+        if self.__headers is None:
+            raise HeadersNeeded()
+
+        pos = self._header_pos.get(key)
+        if pos is None or pos >= len(self.__headers) or self.__headers[pos] != key:
+            # The headers list may have been modified in place.
+            self._index_headers()
+            pos = self._header_pos.get(key)
+            if pos is None:
+                raise KeyError(key)
+        return pos
+
     def _validate(self, row=None, col=None, safety=False):
         """Assures size of every row in dataset is of proper proportions."""
         if row:
@@ -282,29 +939,139 @@ class Dataset:
         """Packages Dataset into lists of dictionaries for transmission."""
         # TODO: Dicts default to false?
 
-        _data = list(self._data)
-
-        def format_row(row):
-            # Execute formatters
-            if self._formatters:
-                row = row.copy()  # To not mutate internal data structure
-                for col, callback in self._formatters:
-                    if col is None:
-                        # Apply formatter to all cells
-                        row = [callback(cell) for cell in row]
-                    else:
-                        row[col] = callback(row[col])
-            return list(row)
+        _data = self._formatted_rows()
 
         if self.headers:
             if dicts:
-                data = [dict(list(zip(self.headers, format_row(row)))) for row in _data]
+                data = [dict(zip(self.headers, row)) for row in _data]
             else:
-                data = [list(self.headers)] + [format_row(row) for row in _data]
+                data = [list(self.headers)] + [list(row) for row in _data]
         else:
-            data = [format_row(row) for row in _data]
+            data = [list(row) for row in _data]
         return data
 
+    def _compile_formatters(self):
+        """Returns a ``{col_index: callable}`` map applying, for each formatted
+        column, all its formatters in the order they were added."""
+        width = self.width
+        chains = {}
+        for col, callback in self._formatters:
+            if col is None:
+                # Apply formatter to all cells
+                targets = range(width)
+            else:
+                targets = [col + width if col < 0 else col]
+            for target in targets:
+                chains.setdefault(target, []).append(callback)
+        return {col: _chain(callbacks) for col, callbacks in chains.items()}
+
+    def _formatted_rows(self):
+        """Returns the rows of the Dataset with the formatters applied."""
+        if not self._formatters:
+            return self._data.values() if self._columnar else self._data
+        if self._formatted is not None:
+            return self._formatted
+        if self.height == 0:
+            return []
+
+        if self._columnar:
+            columns = list(self._data.columns)
+        else:
+            columns = list(zip(*(row._row for row in self._data)))
+        for col, transform in self._compile_formatters().items():
+            columns[col] = list(map(transform, columns[col]))
+        rows = list(zip(*columns)) if columns else [()] * self.height
+
+        if self.cache_formatted:
+            self._formatted = rows
+        return rows
+
+    def _iter_values(self):
+        """Yields the raw values of each row, as a sequence."""
+        if self._columnar:
+            return self._data.values()
+        return (row._row for row in self._data)
+
+    def _iter_formatted(self):
+        """Yields the values of each row, as a sequence, with the formatters
+        applied."""
+        if self._formatted is not None or self.cache_formatted:
+            yield from self._formatted_rows()
+            return
+
+        transforms = list(self._compile_formatters().items())
+        if not transforms:
+            yield from self._iter_values()
+            return
+
+        for row in self._iter_values():
+            row = list(row)  # To not mutate internal data structure
+            for col, transform in transforms:
+                row[col] = transform(row[col])
+            yield row
+
+    def _before_write(self):
+        """Called by the methods modifying the Dataset, before any change."""
+        self._formatted = None
+
+        # Views on this Dataset take their own copy of the rows first.
+        if self._views:
+            views, self._views = list(self._views), None
+            for view in views:
+                view._before_write()
+
+        if isinstance(self._data, RowsView):
+            self._data = self._data.materialize(self._storage)
+
+    def _reset_indexes(self):
+        """Drops the tag index, and the column indexes until their next use."""
+        self._tag_index = None
+        for col_index in self._indexes.values():
+            col_index.positions = None
+
+    def _column_pos(self, column):
+        """Returns the position of `column`, a header str or an index int."""
+        if isinstance(column, str):
+            return self._header_index(column)
+        return column
+
+    def _column_index(self, column):
+        """Returns the up-to-date index created on `column`."""
+        col_index = self._indexes[column]
+        if col_index.positions is None:
+            pos = self._column_pos(column)
+            col_index.build(pos, self.get_col(pos))
+        return col_index
+
+    def _check_unique(self, rows, replacing=None):
+        """Raises DuplicateKey if `rows` would break a unique index."""
+        for column, col_index in self._indexes.items():
+            if col_index.unique:
+                col_index = self._column_index(column)
+                col_index.check([row[col_index.pos] for row in rows], replacing)
+
+    def _view(self, segments, cols=None, parents=None):
+        """Returns a new :class:`Dataset` reading the given rows of this
+        Dataset, and of other `parents` if the segments refer to them, until
+        it or any of its parents is modified."""
+        _dset = Dataset(storage=self._storage, cache_formatted=self.cache_formatted)
+        _dset._data = RowsView(segments, cols)
+        for parent in parents or (self,):
+            if parent._views is None:
+                parent._views = WeakSet()
+            parent._views.add(_dset)
+        return _dset
+
+    def _inherit(self, _dset):
+        """Copies headers, title, formatters, separators and dynamic columns
+        to `_dset`."""
+        _dset.headers = self.headers
+        _dset.title = self.title
+        _dset._formatters = list(self._formatters)
+        _dset._separators = list(self._separators)
+        _dset._dynamic_columns = dict(self._dynamic_columns)
+        return _dset
+
     def _get_headers(self):
         """An *optional* list of strings to be used for header rows and attribute names.
 
@@ -320,6 +1087,8 @@ class Dataset:
             self.__headers = list(collection)
         else:
             self.__headers = None
+        self._index_headers()
+        self._reset_indexes()
 
     headers = property(_get_headers, _set_headers)
 
@@ -363,15 +1132,13 @@ class Dataset:
         # if list of rows
         if isinstance(pickle[0], list):
             self.wipe()
-            for row in pickle:
-                self.append(Row(row))
+            self.extend(pickle)
 
         # if list of objects
         elif isinstance(pickle[0], dict):
             self.wipe()
             self.headers = list(pickle[0].keys())
-            for row in pickle:
-                self.append(Row(list(row.values())))
+            self.extend(row.values() for row in pickle)
         else:
             raise UnsupportedFormat(error_details)
 
@@ -396,12 +1163,99 @@ class Dataset:
         """
         return len(self._data)
 
+    @property
+    def storage(self):
+        """The storage layout of the :class:`Dataset`, ``'rows'`` or ``'columnar'``.
+           Cannot be directly modified.
+        """
+        return self._storage
+
+    @property
+    def schema(self):
+        """The ``{column: type}`` dictionary of the columns stored in typed
+        arrays, columns being given by header if any, or by index.
+        Set with :meth:`Dataset.set_schema`.
+        """
+        if isinstance(self._data, RowsView):
+            kinds = self._data.column_types()
+        elif self._columnar:
+            kinds = map(_column_type, self._data.columns)
+        else:
+            return {}
+        return {
+            self.headers[pos] if self.headers else pos: kind
+            for pos, kind in enumerate(kinds)
+            if kind is not None
+        }
+
+    def set_schema(self, schema='infer', categories=0.5):
+        """Stores columns holding only ``int``, ``float`` or ``bool`` values in
+        typed arrays, rather than lists of Python objects, and columns
+        repeating a few values (such as countries or statuses) as small
+        integer codes into a table of their distinct values. This takes a
+        fraction of the memory, while reads still return Python values.
+
+        Typed columns need the columnar storage, to which the
+        :class:`Dataset` is switched if needed. A typed column is turned back
+        into a list as soon as it is given a value it cannot hold: a value of
+        another type (including ``None``) for arrays, an unhashable value for
+        dictionary-encoded columns.
+
+        :param schema: a ``{column: type}`` dictionary, ``type`` being
+            ``int``, ``float``, ``bool``, ``'category'`` to dictionary-encode
+            the column, or ``None`` to store it as a list. By default
+            (``'infer'``), every column whose values all are of one of these
+            types is typed, and other columns are dictionary-encoded if their
+            number of distinct values is at most ``categories`` times their
+            length.
+
+        Raises ``TypeError`` if a column holds values which cannot be stored
+        as given by ``schema``.
+        """
+        self._before_write()
+        if not self._columnar:
+            self._data = ColumnStore(self._data)
+            self._storage = 'columnar'
+
+        data = self._data
+        if not data and not data.columns and self.headers:
+            data.columns = [[] for _ in self.headers]
+
+        if schema == 'infer':
+            schema = {}
+            for pos, col in enumerate(data.columns):
+                kind = type(col[0]) if len(col) else None
+                if kind in TYPECODES and _fits(kind, col):
+                    schema[pos] = kind
+                elif (
+                    kind is not None and categories and _fits('category', col)
+                    and len({(value.__class__, value) for value in col}) <= categories * len(col)
+                ):
+                    schema[pos] = 'category'
+
+        for column, kind in schema.items():
+            pos = self._column_pos(column)
+            col = data.columns[pos]
+            if kind is None:
+                data.columns[pos] = list(col)
+                continue
+            elif kind not in TYPECODES and kind != 'category':
+                raise TypeError(f'Columns cannot be typed as {kind!r}.')
+            elif _column_type(col) == kind:
+                continue
+            typed = _typed_column(kind, col)
+            if typed is None:
+                raise TypeError(f'Column {column!r} cannot be typed as {kind!r}.')
+            data.columns[pos] = typed
+
     @property
     def width(self):
         """The number of columns currently in the :class:`Dataset`.
            Cannot be directly modified.
         """
 
+        if self._columnar and self._data:
+            return self._data.width
         try:
             return len(self._data[0])
         except IndexError:
@@ -410,11 +1264,14 @@ class Dataset:
             except TypeError:
                 return 0
 
-    def load(self, in_stream, format=None, **kwargs):
+    def load(self, in_stream, format=None, schema=None, **kwargs):
         """
         Import `in_stream` to the :class:`Dataset` object using the `format`.
         `in_stream` can be a file-like object, a string, or a bytestring.
 
+        :param schema: (optional) ``{column: type}`` dictionary, or ``'infer'``,
+            to store the imported columns in typed arrays or dictionary-encoded,
+            see :meth:`Dataset.set_schema`.
         :param \\*\\*kwargs: (optional) custom configuration to the format `import_set`.
         """
 
@@ -427,6 +1284,8 @@ class Dataset:
             raise UnsupportedFormat(f'Format {format} cannot be imported.')
 
         fmt.import_set(self, stream, **kwargs)
+        if schema:
+            self.set_schema(schema)
         return self
 
     def export(self, format, **kwargs):
@@ -460,10 +1319,53 @@ class Dataset:
 
         self._validate(row)
         if len(row) < self.width:
-            for pos, func in self._dynamic_columns.items():
-                row = list(row)
-                row.insert(pos, func(row))
-        self._data.insert(index, Row(row, tags=tags))
+            row = self._fill_dynamic_columns(row)
+        self._check_unique([row])
+        self._before_write()
+
+        height = self.height
+        if self._columnar:
+            self._data.insert(index, row, tags)
+        else:
+            self._data.insert(index, Row(row, tags=tags))
+
+        if self._tag_index is not None:
+            if index >= height:
+                self._tag_index.add(height, 1, tags)
+            else:
+                self._tag_index = None
+
+        for col_index in self._indexes.values():
+            if col_index.positions is None:
+                continue
+            if index >= height:
+                col_index.add(height, row[col_index.pos])
+            elif index == 0 or index <= -height:
+                col_index.base -= 1
+                col_index.add(0, row[col_index.pos])
+            else:
+                col_index.positions = None
+
+    def _take(self, indexes, copy=False):
+        """Returns a new row container with the rows at the given positions.
+
+        With rows storage, :class:`Row` objects are shared unless ``copy`` is set.
+        """
+        if self._columnar:
+            return self._data.take(indexes)
+        rows = [self._data[i] for i in indexes]
+        if self._storage == 'columnar':
+            return ColumnStore(rows)
+        if copy:
+            return [row.copy() for row in rows]
+        return rows
+
+    def _fill_dynamic_columns(self, row):
+        """Returns `row` completed with the values of the dynamic columns."""
+        row = list(row)
+        for pos, func in self._dynamic_columns.items():
+            row.insert(pos, func(row))
+        return row
 
     def rpush(self, row, tags=()):
         """Adds a row to the end of the :class:`Dataset`.
@@ -487,12 +1389,44 @@ class Dataset:
         self.rpush(row, tags)
 
     def extend(self, rows, tags=()):
-        """Adds a list of rows to the :class:`Dataset` using
-        :method:`Dataset.append`
+        """Adds a list of rows to the end of the :class:`Dataset`.
+
+        The rows are validated as one batch: if any of them doesn't have the
+        correct size, none of them are added.
+        See :method:`Dataset.insert` for additional documentation.
         """
 
-        for row in rows:
-            self.append(row, tags)
+        rows = list(rows)
+        if not rows:
+            return
+
+        width = self.width or len(rows[0])
+        short_width = width - len(self._dynamic_columns)
+        lengths = set(map(len, rows))
+        if not lengths <= {width, short_width}:
+            raise InvalidDimensions
+
+        if short_width != width and short_width in lengths:
+            rows = [
+                self._fill_dynamic_columns(row) if len(row) == short_width else row
+                for row in rows
+            ]
+        self._check_unique(rows)
+        self._before_write()
+
+        height = self.height
+        if self._columnar:
+            self._data.extend(rows, tags)
+        else:
+            self._data.extend([Row(row, tags) for row in rows])
+
+        if self._tag_index is not None:
+            self._tag_index.add(height, len(rows), tags)
+
+        for col_index in self._indexes.values():
+            if col_index.positions is not None:
+                for i, row in enumerate(rows, height):
+                    col_index.add(i, row[col_index.pos])
 
     def lpop(self):
         """Removes and returns the first row of the :class:`Dataset`."""
@@ -523,6 +1457,49 @@ class Dataset:
 
         raise TypeError('Row indices must be integers.')
 
+    def iterrows(self):
+        """Lazily yields each row of the :class:`Dataset` as a list, with the
+        formatters applied."""
+
+        return map(list, self._iter_formatted())
+
+    def iterdicts(self):
+        """Lazily yields each row of the :class:`Dataset` as a dictionary
+        keyed by headers, with the formatters applied. If no headers have been
+        set, rows are yielded as lists instead, like :attr:`Dataset.dict`."""
+
+        if not self.headers:
+            return self.iterrows()
+        headers = self.headers
+        return (dict(zip(headers, row)) for row in self._iter_formatted())
+
+    def itertuples(self, name='Row'):
+        """Lazily yields each row of the :class:`Dataset` as a named tuple
+        whose fields are the headers, with the formatters applied. Headers
+        which aren't valid field names are replaced by positional names.
+        If ``name`` is ``None``, plain tuples are yielded."""
+
+        if name is None:
+            return map(tuple, self._iter_formatted())
+        if self.headers:
+            fields = [str(header) for header in self.headers]
+        else:
+            fields = [''] * self.width
+        row_type = namedtuple(name, fields, rename=True)
+        return map(row_type._make, self._iter_formatted())
+
+    def iter_chunks(self, size):
+        """Yields the rows of the :class:`Dataset` as new instances of at most
+        ``size`` rows each, which read the rows of this one until either of
+        them is modified."""
+
+        if size < 1:
+            raise ValueError('Chunks must hold at least one row.')
+        height = self.height
+        for start in range(0, height, size):
+            segment = (self._data, range(start, min(start + size, height)))
+            yield self._inherit(self._view([segment]))
+
     # -------
     # Columns
     # -------
@@ -548,6 +1525,8 @@ class Dataset:
         if col is None:
             col = []
 
+        self._before_write()
+
         # Callable Columns...
         if callable(col):
             self._dynamic_columns[self.width] = col
@@ -566,15 +1545,20 @@ class Dataset:
                 raise InvalidDimensions
 
             self.headers.insert(index, header)
+            self._index_headers()
 
+        self._reset_indexes()
         if self.height and self.width:
+            if self._columnar:
+                self._data.insert_col(index, col)
+                return
 
             for i, row in enumerate(self._data):
 
                 row.insert(index, col[i])
                 self._data[i] = row
         else:
-            self._data = [Row([row]) for row in col]
+            self._data = self._new_data([row] for row in col)
 
     def rpush_col(self, col, header=None):
         """Adds a column to the end of the :class:`Dataset`.
@@ -617,6 +1601,8 @@ class Dataset:
     def get_col(self, index):
         """Returns the column from the :class:`Dataset` at the given index."""
 
+        if isinstance(self._data, (ColumnStore, RowsView)):
+            return self._data.get_col(index)
         return [row[index] for row in self._data]
 
     # ----
@@ -633,62 +1619,153 @@ class Dataset:
         """
 
         if isinstance(col, str):
-            if col in self.headers:
-                col = self.headers.index(col)  # get 'key' index from each data
-            else:
-                raise KeyError
+            col = self._header_index(col)
 
         if col is None or col <= self.width:
+            self._formatted = None
             self._formatters.append((col, handler))
         else:
             raise InvalidDatasetIndex
 
         return True
 
-    def filter(self, tag):
+    def filter(self, tag=None, exclude=None, match_all=False):
         """Returns a new instance of the :class:`Dataset`, excluding any rows
         that do not contain the given :ref:`tags <tags>`.
+
+        :param tag: a tag, or a list of tags. Rows carrying any of them are
+                    kept, or only rows carrying all of them if ``match_all``
+                    is ``True``.
+        :param exclude: (optional) a tag, or a list of tags. Rows carrying any
+                        of them are left out. If ``tag`` is ``None``, all the
+                        other rows are kept.
+
+        The new instance reads the rows of this one until either of them is
+        modified, at which point the rows are copied.
         """
-        _dset = copy(self)
-        _dset._data = [row for row in _dset._data if row.has_tag(tag)]
+        if self._tag_index is None:
+            if self._columnar:
+                self._tag_index = TagIndex(self._data.tags)
+            else:
+                self._tag_index = TagIndex(row.tags for row in self._data)
+        index = self._tag_index
 
-        return _dset
+        if tag is None and exclude is not None:
+            positions = set(range(self.height))
+        elif match_all:
+            positions = index.match_all(tag)
+        else:
+            positions = index.match(tag)
+        if exclude is not None:
+            positions -= index.match(exclude)
 
-    def sort(self, col, reverse=False):
-        """Sort a :class:`Dataset` by a specific column, given string (for
-        header) or integer (for column index). The order can be reversed by
-        setting ``reverse`` to ``True``.
+        return self._inherit(self._view([(self._data, sorted(positions))]))
+
+    def create_index(self, column, unique=False):
+        """Creates a hash index on the values of ``column`` (header str or
+        index int), so that :meth:`lookup` and :meth:`upsert` on it don't have
+        to scan the rows.
 
-        Returns a new :class:`Dataset` instance where columns have been
-        sorted.
+        The index follows the rows appended, prepended, replaced or removed
+        from either end of the :class:`Dataset`; other changes have it rebuilt
+        on its next use.
+
+        :param unique: if ``True``, rows repeating a value of the column are
+                       rejected with :class:`~tablib.exceptions.DuplicateKey`.
+        """
+        col_index = ColumnIndex(column, unique)
+        pos = self._column_pos(column)
+        col_index.build(pos, self.get_col(pos))
+        self._indexes[column] = col_index
+
+    def drop_index(self, column):
+        """Removes the index created on ``column`` by :meth:`create_index`."""
+        del self._indexes[column]
+
+    def _lookup(self, column, value):
+        if column in self._indexes:
+            return self._column_index(column).get(value)
+        col = self.get_col(self._column_pos(column))
+        return [i for i, cell in enumerate(col) if cell == value]
+
+    def lookup(self, column, value):
+        """Returns the list of the rows (as tuples) whose ``column`` holds
+        ``value``, using the index created on ``column`` by
+        :meth:`create_index` if any, or else a scan of the column.
         """
+        return [self[i] for i in self._lookup(column, value)]
 
-        if isinstance(col, str):
+    def upsert(self, row, key):
+        """Replaces the rows holding the same value as ``row`` in the ``key``
+        column (header str or index int), or appends ``row`` if there is none.
+        """
+        positions = self._lookup(key, row[self._column_pos(key)])
+        if not positions:
+            self.append(row)
+        for i in positions:
+            self[i] = row
 
-            if not self.headers:
-                raise HeadersNeeded
+    def sort(self, col=None, reverse=False, key=None, inplace=False):
+        """Sort a :class:`Dataset` by a specific column, given string (for
+        header) or integer (for column index). The order can be reversed by
+        setting ``reverse`` to ``True``.
+
+        ``col`` can also be a list of columns: rows are then ordered by the
+        first column, ties by the second one, and so on. ``reverse`` can be a
+        list of the same length to give the direction of each column.
 
-            _sorted = sorted(self.dict, key=itemgetter(col), reverse=reverse)
-            _dset = Dataset(headers=self.headers, title=self.title)
+        If ``key`` is given, it is called with every value of the sorted
+        columns, or with the values of each row if ``col`` is ``None``, and
+        the results are compared instead.
 
-            for item in _sorted:
-                row = [item[key] for key in self.headers]
-                _dset.append(row=row)
+        Row tags are kept. Returns a new :class:`Dataset` instance where rows
+        have been sorted, or sorts this :class:`Dataset` and returns ``None``
+        if ``inplace`` is ``True``.
+        """
 
+        if col is None:
+            cols = []
+        elif isinstance(col, (list, tuple)):
+            cols = list(col)
         else:
-            if self.headers:
-                col = self.headers[col]
+            cols = [col]
 
-            _sorted = sorted(self.dict, key=itemgetter(col), reverse=reverse)
-            _dset = Dataset(headers=self.headers, title=self.title)
+        if isinstance(reverse, (list, tuple)):
+            if len(reverse) != len(cols):
+                raise ValueError('reverse must have one entry per sorted column.')
+            directions = list(reverse)
+        else:
+            directions = [reverse] * len(cols)
+
+        order = list(range(self.height))
+        if cols:
+            # Stable sorts, from the least to the most significant column.
+            for col, direction in reversed(list(zip(cols, directions))):
+                if isinstance(col, str):
+                    col = self._header_index(col)
+                values = self.get_col(col)
+                if key is not None:
+                    values = [key(value) for value in values]
+                order.sort(key=values.__getitem__, reverse=direction)
+        elif key is not None:
+            if self._columnar:
+                values = [key(row) for row in self._data.values()]
+            else:
+                values = [key(row._row) for row in self._data]
+            order.sort(key=values.__getitem__, reverse=reverse)
+        else:
+            raise TypeError('sort() needs a column or a key.')
 
-            for item in _sorted:
-                if self.headers:
-                    row = [item[key] for key in self.headers]
-                else:
-                    row = item
-                _dset.append(row=row)
+        if inplace:
+            self._before_write()
+            self._reset_indexes()
+            self._data = self._take(order)
+            return
 
+        _dset = Dataset(headers=self.headers, title=self.title, storage=self._storage)
+        _dset._data = self._take(order, copy=True)
+        _dset._formatters = list(self._formatters)
+        _dset._dynamic_columns = dict(self._dynamic_columns)
         return _dset
 
     def _transpose_with_headers(self):
@@ -696,7 +1773,7 @@ class Dataset:
         versa, returning a new ``Dataset`` instance. The first row of the
         original instance becomes the new header row."""
 
-        _dset = Dataset()
+        _dset = Dataset(storage=self._storage)
         # The first element of the headers stays in the headers,
         # it is our "hinge" on which we rotate the data
         new_headers = [self.headers[0]] + self[self.headers[0]]
@@ -720,10 +1797,10 @@ class Dataset:
         versa, returning a new ``Dataset`` instance. This instance should not
         have headers, or the dimension would be invalid."""
 
-        _dset = Dataset()
+        _dset = Dataset(storage=self._storage)
 
         # Add columns as rows in new instance
-        for index in range(len(self._data[0])):
+        for index in range(self.width):
             row_data = self.get_col(index)
             _dset.append(row=row_data)
 
@@ -747,7 +1824,10 @@ class Dataset:
     def stack(self, other):
         """Stack two :class:`Dataset` instances together by
         joining at the row level, and return new combined
-        ``Dataset`` instance."""
+        ``Dataset`` instance.
+
+        The new instance reads the rows of both instances until any of them
+        is modified, at which point the rows are copied."""
 
         if not isinstance(other, Dataset):
             raise TypeError("'other' must be a Dataset instance")
@@ -755,16 +1835,11 @@ class Dataset:
         if self.width != other.width:
             raise InvalidDimensions
 
-        # Copy the source data
-        _dset = copy(self)
-
-        rows_to_stack = list(_dset._data)
-        other_rows = list(other._data)
-
-        rows_to_stack.extend(other_rows)
-        _dset._data = rows_to_stack
-
-        return _dset
+        _dset = self._view(
+            [(self._data, range(self.height)), (other._data, range(other.height))],
+            parents=(self, other),
+        )
+        return self._inherit(_dset)
 
     def stack_cols(self, other):
         """Stack two :class:`Dataset` instances together by
@@ -787,7 +1862,7 @@ class Dataset:
         except TypeError:
             new_headers = None
 
-        _dset = Dataset()
+        _dset = Dataset(storage=self._storage)
 
         if self.headers:
             for column in self.headers:
@@ -806,57 +1881,476 @@ class Dataset:
 
         return _dset
 
-    def remove_duplicates(self):
-        """Removes all duplicate rows from the :class:`Dataset` object
-        while maintaining the original order."""
-        seen = set()
-        self._data[:] = [
-            row for row in self._data if not (tuple(row) in seen or seen.add(tuple(row)))
+    def join(self, other, on, how='inner', method='hash', suffix='_right'):
+        """Join two :class:`Dataset` instances on equal values of the ``on``
+        columns, and return a new combined ``Dataset`` instance. Both
+        ``Dataset`` instances must have headers set.
+
+        :param on: a header, or a list of headers, found in both instances.
+        :param how: ``'inner'`` (the default) keeps the rows having a match in
+                    ``other``. ``'left'`` also keeps the rows of this instance
+                    without a match, and ``'outer'`` the rows of both instances
+                    without a match. Missing values are ``None``.
+        :param method: ``'hash'`` (the default) builds a hash table on the
+                       smaller instance. ``'merge'`` walks both instances in
+                       step and requires them to be sorted on ``on``.
+        :param suffix: appended to the headers of ``other`` which are also
+                       headers of this instance.
+
+        The ``on`` columns appear once, at their position in this instance,
+        followed by the other columns of ``other``. Rows follow the order of
+        this instance, then rows of ``other`` without a match come last.
+        """
+
+        if not isinstance(other, Dataset):
+            raise TypeError("'other' must be a Dataset instance")
+        if how not in ('inner', 'left', 'outer'):
+            raise ValueError("how must be 'inner', 'left' or 'outer'.")
+        if method not in ('hash', 'merge'):
+            raise ValueError("method must be 'hash' or 'merge'.")
+        if not self.headers or not other.headers:
+            raise HeadersNeeded
+
+        on = [on] if isinstance(on, str) else list(on)
+        left_on = [self._header_index(header) for header in on]
+        right_on = [other._header_index(header) for header in on]
+        right_rest = [pos for pos in range(other.width) if pos not in right_on]
+
+        left_rows = list(self._iter_values())
+        right_rows = list(other._iter_values())
+        left_keys = list(map(_projection(left_on), left_rows))
+        right_keys = list(map(_projection(right_on), right_rows))
+
+        join_pairs = _hash_join if method == 'hash' else _merge_join
+        pairs = join_pairs(left_keys, right_keys, how != 'inner', how == 'outer')
+
+        rest = _projection(right_rest)
+        no_match = (None,) * len(right_rest)
+        rows = []
+        for left, right in pairs:
+            if left is None:
+                row = [None] * self.width
+                for pos, value in zip(left_on, right_keys[right]):
+                    row[pos] = value
+            else:
+                row = list(left_rows[left])
+            row.extend(no_match if right is None else rest(right_rows[right]))
+            rows.append(row)
+
+        own_headers = set(self.headers)
+        headers = list(self.headers) + [
+            f'{header}{suffix}' if header in own_headers else header
+            for header in (other.headers[pos] for pos in right_rest)
         ]
+        return Dataset.from_rows(rows, headers=headers, copy=False, storage=self._storage)
+
+    def group_by(self, keys):
+        """Groups the rows of the :class:`Dataset` on equal values of the
+        ``keys`` columns (header str or index int, or a list of them), in
+        order to aggregate the other columns. ::
+
+            totals = data.group_by('country').agg({'amount': 'sum', 'id': 'count'})
+
+        See :meth:`GroupBy.agg`.
+        """
+
+        keys = list(keys) if isinstance(keys, (list, tuple)) else [keys]
+        return GroupBy(self, keys)
+
+    def remove_duplicates(self, keys=None, keep='first'):
+        """Removes all duplicate rows from the :class:`Dataset` object
+        while maintaining the original order.
+
+        :param keys: (optional) columns (header str or index int) to compare
+                     rows on. Whole rows are compared by default.
+        :param keep: ``'first'`` (the default) or ``'last'``, the occurrence
+                     of each duplicated row to keep.
+        """
+
+        if keep not in ('first', 'last'):
+            raise ValueError("keep must be 'first' or 'last'.")
+
+        if keys is None:
+            getter = tuple
+        else:
+            getter = _projection([
+                self._header_index(key) if isinstance(key, str) else key for key in keys
+            ])
+
+        if self._columnar:
+            row_keys = [getter(values) for values in self._data.values()]
+        else:
+            row_keys = [getter(row._row) for row in self._data]
+
+        positions = range(len(row_keys))
+        if keep == 'last':
+            positions = reversed(positions)
+        kept = list(_unique(positions, row_keys.__getitem__))
+        if len(kept) == len(row_keys):
+            return
+        if keep == 'last':
+            kept.reverse()
+
+        self._before_write()
+        self._reset_indexes()
+        self._data = self._take(kept)
 
     def wipe(self):
         """Removes all content and headers from the :class:`Dataset` object."""
-        self._data = []
+        self._before_write()
+        self._tag_index = None
+        self._indexes = {}
+        self._data = self._new_data()
         self.__headers = None
+        self._header_pos = {}
 
     def subset(self, rows=None, cols=None):
         """Returns a new instance of the :class:`Dataset`,
         including only specified rows and columns.
+
+        ``rows`` can be an iterable of row indexes, a slice, or a list of
+        booleans with one entry per row. Rows are kept in their original
+        order and indexes out of range are ignored. ``cols`` is an iterable
+        of headers; unknown headers are ignored.
+
+        The new instance reads the rows of this one until either of them is
+        modified, at which point the rows are copied.
         """
 
         # Don't return if no data
         if not self:
             return
 
+        height = self.height
         if rows is None:
-            rows = list(range(self.height))
+            positions = range(height)
+        elif isinstance(rows, slice):
+            positions = range(*rows.indices(height))
+            if positions.step < 0:
+                positions = positions[::-1]
+        else:
+            rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+            if rows and all(isinstance(row, bool) for row in rows):
+                if len(rows) != height:
+                    raise InvalidDimensions
+                positions = [row_no for row_no, keep in enumerate(rows) if keep]
+            else:
+                # filter out impossible rows
+                positions = sorted({row for row in rows if 0 <= row < height})
 
         if cols is None:
             cols = list(self.headers)
 
-        # filter out impossible rows and columns
-        rows = [row for row in rows if row in range(self.height)]
-        cols = [header for header in cols if header in self.headers]
+        # filter out impossible columns
+        self._index_headers()
+        cols = [header for header in cols if header in self._header_pos]
+
+        _dset = self._view(
+            [(self._data, positions)], cols=[self._header_pos[key] for key in cols]
+        )
+        _dset.headers = cols
+
+        return _dset
+
 
-        _dset = Dataset()
+class GroupBy:
+    """Rows of a :class:`Dataset` grouped on equal values of some columns.
+    Returned by :meth:`Dataset.group_by`.
+    """
+
+    def __init__(self, dataset, keys):
+        self.dataset = dataset
+        self.keys = keys
+
+    def agg(self, aggregates):
+        """Aggregates each group into one row, and returns a new
+        :class:`Dataset` instance with the key columns followed by the
+        aggregated columns, groups being in order of first appearance.
 
-        # filtering rows and columns
-        _dset.headers = list(cols)
+        :param aggregates: a ``{column: aggregate}`` dictionary. An aggregate
+            is one of ``'sum'``, ``'count'``, ``'min'``, ``'max'``, ``'mean'``,
+            or a callable receiving the list of values of the group. ``None``
+            values are ignored by the named aggregates. An aggregate can also
+            be a list of aggregates, in which case the new headers are
+            suffixed with the aggregate names.
 
-        _dset._data = []
-        for row_no, row in enumerate(self._data):
-            data_row = []
-            for key in _dset.headers:
-                if key in self.headers:
-                    pos = self.headers.index(key)
-                    data_row.append(row[pos])
+        Rows are read in a single pass, each group only keeping a running
+        value per aggregate (callables need the values to be collected).
+        """
+
+        dataset = self.dataset
+        key_positions = [dataset._column_pos(key) for key in self.keys]
+
+        names = []
+        columns = []
+        for col, funcs in aggregates.items():
+            suffix = isinstance(funcs, (list, tuple))
+            for func in funcs if suffix else [funcs]:
+                if callable(func):
+                    factory = partial(_Collect, func)
+                elif func in AGGREGATES:
+                    factory = AGGREGATES[func]
+                else:
+                    raise ValueError(f"Unknown aggregate '{func}'.")
+                if suffix:
+                    func_name = getattr(func, '__name__', repr(func)) if callable(func) else func
+                    names.append(f'{col}_{func_name}')
                 else:
-                    raise KeyError
+                    names.append(col)
+                columns.append((dataset._column_pos(col), factory))
+
+        key_of = _projection(key_positions)
+        groups = {}
+        for row in dataset._iter_values():
+            key = key_of(row)
+            accumulators = groups.get(key)
+            if accumulators is None:
+                accumulators = groups[key] = [factory() for _, factory in columns]
+            for (pos, _), accumulator in zip(columns, accumulators):
+                accumulator.add(row[pos])
+
+        rows = [
+            [*key, *(accumulator.result() for accumulator in accumulators)]
+            for key, accumulators in groups.items()
+        ]
+        if dataset.headers:
+            headers = [dataset.headers[pos] for pos in key_positions] + names
+        else:
+            headers = None
+        return Dataset.from_rows(rows, headers=headers, copy=False, storage=dataset.storage)
 
-            if row_no in rows:
-                _dset.append(row=Row(data_row))
 
-        return _dset
+class _Sum:
+    __slots__ = ['value']
+
+    def __init__(self):
+        self.value = 0
+
+    def add(self, value):
+        if value is not None:
+            self.value += value
+
+    def result(self):
+        return self.value
+
+
+class _Count:
+    __slots__ = ['value']
+
+    def __init__(self):
+        self.value = 0
+
+    def add(self, value):
+        if value is not None:
+            self.value += 1
+
+    def result(self):
+        return self.value
+
+
+class _Min:
+    __slots__ = ['value']
+
+    def __init__(self):
+        self.value = None
+
+    def add(self, value):
+        if value is not None and (self.value is None or value < self.value):
+            self.value = value
+
+    def result(self):
+        return self.value
+
+
+class _Max(_Min):
+    __slots__ = []
+
+    def add(self, value):
+        if value is not None and (self.value is None or value > self.value):
+            self.value = value
+
+
+class _Mean:
+    __slots__ = ['total', 'count']
+
+    def __init__(self):
+        self.total = 0
+        self.count = 0
+
+    def add(self, value):
+        if value is not None:
+            self.total += value
+            self.count += 1
+
+    def result(self):
+        return self.total / self.count if self.count else None
+
+
+class _Collect:
+    __slots__ = ['func', 'values']
+
+    def __init__(self, func):
+        self.func = func
+        self.values = []
+
+    def add(self, value):
+        self.values.append(value)
+
+    def result(self):
+        return self.func(self.values)
+
+
+AGGREGATES = {
+    'count': _Count,
+    'max': _Max,
+    'mean': _Mean,
+    'min': _Min,
+    'sum': _Sum,
+}
+
+
+def _column_type(column):
+    """Returns the type of the values of a typed `column`, ``'category'`` for
+    a dictionary-encoded one, or None for a list."""
+    if isinstance(column, CategoricalColumn):
+        return 'category'
+    elif isinstance(column, BoolArray):
+        return bool
+    elif isinstance(column, array):
+        return float if column.typecode == 'd' else int
+    return None
+
+
+def _fits(kind, values):
+    """Returns whether `values` can be stored in a column typed for `kind`."""
+    if kind == 'category':
+        return all(map(_is_hashable, values))
+    elif kind is int:
+        return all(type(value) is int and -(1 << 63) <= value < (1 << 63) for value in values)
+    return all(type(value) is kind for value in values)
+
+
+def _typed_column(kind, values):
+    """Returns `values` in a column typed for `kind`, or None if they don't fit."""
+    if not _fits(kind, values):
+        return None
+    if kind == 'category':
+        return CategoricalColumn(values)
+    elif kind is bool:
+        return BoolArray(TYPECODES[bool], values)
+    return array(TYPECODES[kind], values)
+
+
+def _is_hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _like(column, values):
+    """Returns `values` in a container of the same type as `column`."""
+    kind = _column_type(column)
+    if kind is None:
+        return values
+    return _typed_column(kind, values)
+
+
+def _column_block(column, protocol):
+    """Returns `column` ready to be pickled: a list as it is, the codes of a
+    typed column as a buffer (or bytes before protocol 5) with their type code,
+    followed by the categories of a dictionary-encoded column."""
+    if isinstance(column, list):
+        return column
+    elif isinstance(column, CategoricalColumn):
+        codes = column.codes
+        return (codes.typecode, _buffer(codes, protocol), column.categories)
+    return (column.typecode, _buffer(column, protocol))
+
+
+def _buffer(values, protocol):
+    return PickleBuffer(values) if protocol >= 5 else values.tobytes()
+
+
+def _restore_column(block, swap):
+    """Returns the column pickled as `block` by _column_block()."""
+    if isinstance(block, list):
+        return block
+    typecode, buffer, *categories = block
+    if typecode == TYPECODES[bool] and not categories:
+        values = BoolArray(typecode)
+    else:
+        values = array(typecode)
+    values.frombytes(memoryview(buffer).cast('B'))
+    if swap:
+        values.byteswap()
+    if not categories:
+        return values
+    column = CategoricalColumn()
+    column.codes = values
+    column.categories = categories[0]
+    column.lookup = {
+        (value.__class__, value): code for code, value in enumerate(column.categories)
+    }
+    return column
+
+
+def _restore_dataset(cls, state, blocks, tags, height, order):
+    """Returns the :class:`Dataset` pickled by :meth:`Dataset.__reduce_ex__`."""
+    dset = cls.__new__(cls)
+    columns = [_restore_column(block, order != byteorder) for block in blocks]
+    if tags is None:
+        tags = [()] * height
+
+    if state['_storage'] == 'columnar':
+        dset._data = ColumnStore.from_columns(columns, height)
+        dset._data.tags = [tuple(row_tags) for row_tags in tags]
+    elif columns:
+        dset._data = [
+            Row.adopt(list(values), row_tags) for values, row_tags in zip(zip(*columns), tags)
+        ]
+    else:
+        dset._data = [Row(tags=row_tags) for row_tags in tags]
+    dset.__setstate__(state)
+    return dset
+
+
+def _match_tags(row_tags, tag):
+    """Returns true if `row_tags` contains `tag`, or any of the tags in `tag`
+    if it is a collection."""
+    if tag is None:
+        return False
+    elif isinstance(tag, str):
+        return tag in row_tags
+    else:
+        return bool(len(set(tag) & set(row_tags)))
+
+
+_first = itemgetter(0)
+
+
+def _projection(cols):
+    """Returns a callable picking the values at positions `cols` of a row,
+    as a tuple."""
+    if len(cols) == 1:
+        pos = cols[0]
+        return lambda row: (row[pos],)
+    elif not cols:
+        return lambda row: ()
+    return itemgetter(*cols)
+
+
+def _chain(callbacks):
+    """Returns a callable applying all `callbacks` one after the other."""
+    if len(callbacks) == 1:
+        return callbacks[0]
+
+    def apply(value):
+        for callback in callbacks:
+            value = callback(value)
+        return value
+    return apply
 
 
 class Databook:
@@ -866,6 +2360,9 @@ class Databook:
     def __init__(self, sets=None):
         self._datasets = sets or []
 
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (self._datasets,)
+
     def __repr__(self):
         try:
             return f'<{self.title.lower()} databook>'
@@ -951,12 +2448,249 @@ def detect_format(stream):
     return fmt_title
 
 
+def unique_rows(rows, keys=None):
+    """Yields the rows of the `rows` iterable, skipping the ones equal to an
+    earlier row.
+
+    If `keys` is given, rows are only compared on the values at these keys
+    (indexes for sequences, keys for mappings). Unhashable values such as
+    lists or dicts are supported.
+    """
+
+    return _unique(rows, tuple if keys is None else _projection(list(keys)))
+
+
+def _unique(items, key):
+    """Yields the items whose `key` was not seen yet."""
+    seen = set()
+    for item in items:
+        value = key(item)
+        size = len(seen)
+        try:
+            seen.add(value)
+        except TypeError:
+            seen.add(_hashable(value))
+        if len(seen) != size:
+            yield item
+
+
+def _hash_join(left_keys, right_keys, keep_left, keep_right):
+    """Returns the ``(left, right)`` position pairs of matching keys, using a
+    hash table of the smaller side. Positions without a match are paired
+    with ``None`` if their side is kept."""
+    pairs = []
+    unmatched_right = []
+
+    if len(right_keys) <= len(left_keys):
+        table = {}
+        for right, key in enumerate(right_keys):
+            table.setdefault(key, []).append(right)
+        matched = set()
+        for left, key in enumerate(left_keys):
+            matches = table.get(key)
+            if matches:
+                pairs.extend((left, right) for right in matches)
+                if keep_right:
+                    matched.update(matches)
+            elif keep_left:
+                pairs.append((left, None))
+        if keep_right:
+            unmatched_right = [r for r in range(len(right_keys)) if r not in matched]
+    else:
+        table = {}
+        for left, key in enumerate(left_keys):
+            table.setdefault(key, []).append(left)
+        matched = set()
+        for right, key in enumerate(right_keys):
+            matches = table.get(key)
+            if matches:
+                pairs.extend((left, right) for left in matches)
+                matched.update(matches)
+            elif keep_right:
+                unmatched_right.append(right)
+        if keep_left:
+            pairs.extend((l, None) for l in range(len(left_keys)) if l not in matched)
+        # Back to the left order, right order being kept for equal keys.
+        pairs.sort(key=_first)
+
+    pairs.extend((None, right) for right in unmatched_right)
+    return pairs
+
+
+def _merge_join(left_keys, right_keys, keep_left, keep_right):
+    """Returns the ``(left, right)`` position pairs of matching keys, walking
+    both sides in step. Both sides must be sorted by key."""
+    for keys in (left_keys, right_keys):
+        if any(a > b for a, b in zip(keys, keys[1:])):
+            raise ValueError("Datasets must be sorted on the join columns.")
+
+    pairs = []
+    unmatched_right = []
+    left = right = 0
+    left_len, right_len = len(left_keys), len(right_keys)
+    while left < left_len and right < right_len:
+        left_key, right_key = left_keys[left], right_keys[right]
+        if left_key < right_key:
+            if keep_left:
+                pairs.append((left, None))
+            left += 1
+        elif right_key < left_key:
+            if keep_right:
+                unmatched_right.append(right)
+            right += 1
+        else:
+            left_end, right_end = left + 1, right + 1
+            while left_end < left_len and left_keys[left_end] == left_key:
+                left_end += 1
+            while right_end < right_len and right_keys[right_end] == right_key:
+                right_end += 1
+            pairs.extend(
+                (l, r) for l in range(left, left_end) for r in range(right, right_end)
+            )
+            left, right = left_end, right_end
+
+    if keep_left:
+        pairs.extend((l, None) for l in range(left, left_len))
+    if keep_right:
+        unmatched_right.extend(range(right, right_len))
+    pairs.extend((None, r) for r in unmatched_right)
+    return pairs
+
+
+def _hashable(value):
+    """Returns a hashable equivalent of `value`, keeping values of different
+    container types distinct."""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+    if isinstance(value, dict):
+        return (dict, frozenset((key, _hashable(item)) for key, item in value.items()))
+    elif isinstance(value, (set, frozenset)):
+        return (set, frozenset(_hashable(item) for item in value))
+    elif isinstance(value, (list, tuple)):
+        return (type(value), tuple(_hashable(item) for item in value))
+    return (type(value), repr(value))
+
+
 def import_set(stream, format=None, **kwargs):
     """Return dataset of given stream (file-like object, string, or bytestring)."""
 
     return Dataset().load(stream, format, **kwargs)
 
 
+def iter_import(stream, format=None, chunk_size=1000, headers=True, **kwargs):
+    """Yields the rows of the given stream (file-like object, string, or
+    bytestring) as :class:`Dataset` objects of at most `chunk_size` rows,
+    while reading it, so that the whole content is never held in memory.
+
+    If `headers` is ``True``, the first row read is used as headers of every
+    :class:`Dataset`. Supported formats are csv, tsv, jsonl, xlsx and dbf.
+
+    :param \\*\\*kwargs: (optional) custom configuration to the format `iter_rows`.
+    """
+
+    if chunk_size < 1:
+        raise ValueError('Chunks must hold at least one row.')
+    stream = normalize_input(stream)
+    if not format:
+        format = detect_format(stream)
+
+    fmt = registry.get_format(format)
+    if not hasattr(fmt, 'iter_rows'):
+        raise UnsupportedFormat(f'Format {format} cannot be imported in chunks.')
+
+    rows = fmt.iter_rows(stream, headers=headers, **kwargs)
+    header_row = next(rows, None) if headers else None
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        dset = Dataset(headers=header_row)
+        dset.extend(chunk)
+        yield dset
+
+
+# Formats whose files are opened in binary mode by iter_rows().
+_BINARY_FORMATS = frozenset(('dbf', 'ods', 'tabbin', 'xls', 'xlsx'))
+
+
+def iter_rows(stream, format=None, headers=True, row_type=list, encoding='utf-8',
+              **kwargs):
+    """Returns an iterator lazily yielding the rows of the given stream
+    (file-like object, path object, string, or bytestring) while reading it,
+    without ever building a :class:`Dataset`. Header and padding semantics
+    are those of the format import, and supported formats are those of
+    :func:`iter_import`.
+
+    Rows are yielded as lists by default. If `row_type` is ``tuple``,
+    ``dict`` or :func:`collections.namedtuple`, they are yielded as such,
+    dicts and namedtuples being keyed by the headers, which are then not
+    yielded themselves.
+
+    Only :class:`os.PathLike` objects (such as :class:`pathlib.Path`) are
+    taken as paths, a ``str`` being the content itself. Paths are opened and
+    closed by the iterator, text formats being decoded with `encoding`.
+
+    :param \\*\\*kwargs: (optional) custom configuration to the format `iter_rows`.
+    """
+
+    if row_type not in (list, tuple, dict, namedtuple):
+        raise ValueError('Rows can only be yielded as list, tuple, dict or namedtuple.')
+    if row_type in (dict, namedtuple) and not headers:
+        raise HeadersNeeded()
+
+    if isinstance(stream, PathLike):
+        return _iter_path_rows(stream, format, headers, row_type, encoding, **kwargs)
+    return _iter_rows(stream, format, headers, row_type, **kwargs)
+
+
+def _iter_path_rows(stream, format, headers, row_type, encoding, **kwargs):
+    if not format:
+        with open(stream, 'rb') as fh:
+            format = detect_format(fh)
+        if format not in _BINARY_FORMATS:
+            with open(stream, newline='', encoding=encoding) as fh:
+                format = detect_format(fh)
+    if format in _BINARY_FORMATS:
+        fh = open(stream, 'rb')
+    else:
+        fh = open(stream, newline='', encoding=encoding)
+    with fh:
+        yield from _iter_rows(fh, format, headers, row_type, **kwargs)
+
+
+def _iter_rows(stream, format, headers, row_type, **kwargs):
+    stream = normalize_input(stream)
+    if not format:
+        format = detect_format(stream)
+
+    fmt = registry.get_format(format)
+    if not hasattr(fmt, 'iter_rows'):
+        raise UnsupportedFormat(f'Format {format} cannot be imported lazily.')
+
+    rows = fmt.iter_rows(stream, headers=headers, **kwargs)
+    if row_type is list:
+        yield from rows
+        return
+    if row_type is tuple:
+        yield from map(tuple, rows)
+        return
+
+    header_row = next(rows, None)
+    if header_row is None:
+        return
+    if row_type is dict:
+        for row in rows:
+            yield dict(zip(header_row, row))
+    else:
+        record = namedtuple('Record', header_row, rename=True)
+        width = len(header_row)
+        for row in rows:
+            yield record._make(row[:width])
+
+
 def import_book(stream, format=None, **kwargs):
     """Return dataset of given stream (file-like object, string, or bytestring)."""
 
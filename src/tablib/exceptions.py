@@ -20,3 +20,7 @@ class HeadersNeeded(TablibException, AttributeError):
 
 class UnsupportedFormat(TablibException, NotImplementedError):
     """Format not supported."""
+
+
+class DuplicateKey(TablibException, ValueError):
+    """A unique index of the Dataset already holds this value."""
@@ -98,6 +98,8 @@ class Registry:
     def register_builtins(self):
         # Registration ordering matters for autodetection.
         self.register('json', JSONFormat())
+        self.register('jsonl', 'tablib.formats._jsonl.JSONLinesFormat')
+        self.register('tabbin', 'tablib.formats._tabbin.TabbinFormat')
         # xlsx before as xls (xlrd) can also read xlsx
         if find_spec('openpyxl'):
             self.register('xlsx', 'tablib.formats._xlsx.XLSXFormat')
@@ -1,10 +1,173 @@
 """ Tablib - *SV Support.
 """
 
-__lazy_modules__ = {"csv", "io"}
+__lazy_modules__ = {
+    "codecs",
+    "concurrent.futures",
+    "csv",
+    "datetime",
+    "functools",
+    "io",
+    "itertools",
+    "mmap",
+    "os",
+    "re",
+    "tablib.utils",
+}
 
+import codecs
 import csv
-from io import StringIO
+import datetime as dt
+import mmap
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import StringIO, TextIOBase, TextIOWrapper
+from itertools import chain, islice
+from os import path as os_path
+
+from ..utils import select_rows
+
+# Size of the blocks in which quote characters are counted
+COUNT_BLOCK_SIZE = 1 << 24
+
+# Line parsed after a byte range, which is a row of its own only if the range
+# doesn't end inside a quoted value
+RANGE_END_SENTINEL = '\ue000'
+
+
+def _to_bool(value):
+    lowered = value.lower()
+    if lowered not in ('true', 'false'):
+        raise ValueError(f'{value!r} is not a boolean.')
+    return lowered == 'true'
+
+
+# Converters of the types given in `dtypes` which can't convert a str themselves
+CONVERTERS = {
+    bool: _to_bool,
+    dt.date: dt.date.fromisoformat,
+    dt.datetime: dt.datetime.fromisoformat,
+}
+
+# Patterns that all the sampled values of a column must match for it to be
+# converted, in order of precedence, with their converter. Numbers with leading
+# zeros are left alone, as they usually are codes rather than quantities.
+INFERRED_TYPES = (
+    (re.compile(r'(?i)(true|false)\Z'), _to_bool),
+    (re.compile(r'[-+]?(0|[1-9][0-9]*)\Z'), int),
+    (re.compile(r'[-+]?((0|[1-9][0-9]*)(\.[0-9]*)?|\.[0-9]+)([eE][-+]?[0-9]+)?\Z'), float),
+    (re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}\Z'), dt.date.fromisoformat),
+    (re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}'), dt.datetime.fromisoformat),
+)
+
+
+def _infer_converter(sample):
+    """Returns the converter of the first inferred type matching all the
+    values of `sample`, or None."""
+    if not sample:
+        return None
+    for pattern, convert in INFERRED_TYPES:
+        if all(map(pattern.match, sample)):
+            return convert
+    return None
+
+
+def _convert(values, convert):
+    """Returns the list of `values` converted by `convert`, empty values
+    becoming None and values which can't be converted being kept as is."""
+    if convert is str:
+        return values
+    try:
+        return [convert(value) if value else None for value in values]
+    except (ArithmeticError, LookupError, TypeError, ValueError):
+        pass
+    converted = []
+    for value in values:
+        try:
+            converted.append(convert(value) if value else None)
+        except (ArithmeticError, LookupError, TypeError, ValueError):
+            converted.append(value)
+    return converted
+
+
+def _is_text(stream):
+    """Returns True if `stream` is written to with str rather than bytes."""
+    mode = getattr(stream, 'mode', None)
+    return isinstance(stream, TextIOBase) or isinstance(mode, str) and 'b' not in mode
+
+
+def _count(buf, start, end, char):
+    """Returns the number of `char` bytes in ``buf[start:end]``."""
+    return sum(
+        buf[pos:min(pos + COUNT_BLOCK_SIZE, end)].count(char)
+        for pos in range(start, end, COUNT_BLOCK_SIZE)
+    )
+
+
+def _record_end(buf, pos, quote, odd=False):
+    """Returns the offset following the first line end of `buf` after `pos`
+    that is not quoted, `odd` telling if `pos` is itself inside quotes."""
+    while True:
+        end = buf.find(b'\n', pos)
+        if end < 0:
+            return len(buf)
+        odd ^= _count(buf, pos, end, quote) % 2 == 1
+        pos = end + 1
+        if not odd:
+            return pos
+
+
+def _stream_newline(stream, buf, pos):
+    """Returns None if the text `stream`, whose content is `buf` and which is
+    at byte `pos`, translates line ends to ``'\\n'``, as ``newline=None``
+    does, and ``''`` if it doesn't. The stream is read up to the first
+    carriage return, then brought back to `pos`."""
+    end = buf.find(b'\r', pos)
+    if end < 0:
+        return ''
+    try:
+        # Each character takes at least one byte, so reading one more
+        # character than the bytes before the carriage return reaches it.
+        size = end - pos + 1
+        while size > 0:
+            text = stream.read(min(size, COUNT_BLOCK_SIZE))
+            if '\r' in text:
+                return ''
+            if not text:
+                break
+            size -= len(text)
+        return None
+    finally:
+        stream.seek(pos)
+
+
+def _parse_records(text, kwargs, newline=''):
+    """Returns the rows of `text`, read with `newline` as a text stream
+    would, and whether it ends at a record boundary."""
+    lines = chain(StringIO(text, newline=newline), [RANGE_END_SENTINEL])
+    rows = list(csv.reader(lines, **kwargs))
+    complete = rows[-1] == [RANGE_END_SENTINEL]
+    if complete:
+        rows.pop()
+    return rows, complete
+
+
+def _split_records(buf, start, count, quote):
+    """Returns the offsets splitting ``buf[start:]`` in at most `count` byte
+    ranges of roughly the same size, all ending at a record boundary."""
+    step = max((len(buf) - start) // count, 1)
+    offsets = [start]
+    for target in range(start + step, len(buf), step):
+        if target <= offsets[-1]:
+            continue
+        odd = _count(buf, offsets[-1], target, quote) % 2 == 1
+        offsets.append(_record_end(buf, target, quote, odd))
+        if len(offsets) == count:
+            break
+    if offsets[-1] < len(buf):
+        offsets.append(len(buf))
+    return offsets
 
 
 class CSVFormat:
@@ -13,45 +176,249 @@ class CSVFormat:
 
     DEFAULT_DELIMITER = ','
 
+    # Number of rows formatted before each write to the output stream
+    BATCH_SIZE = 1000
+
+    # Number of non-empty values of a column sampled to infer its type
+    INFER_SAMPLE_SIZE = 100
+
     @classmethod
     def export_stream_set(cls, dataset, **kwargs):
         """Returns CSV representation of Dataset as file-like."""
         stream = StringIO()
-
-        kwargs.setdefault('delimiter', cls.DEFAULT_DELIMITER)
-
-        _csv = csv.writer(stream, **kwargs)
-
-        for row in dataset._package(dicts=False):
-            _csv.writerow(row)
-
+        cls.write_set(dataset, stream, **kwargs)
         stream.seek(0)
         return stream
 
     @classmethod
-    def export_set(cls, dataset, **kwargs):
-        """Returns CSV representation of Dataset."""
+    def export_set(cls, dataset, stream=None, encoding='utf-8', **kwargs):
+        """Returns CSV representation of Dataset.
+
+        If `stream` is given, the CSV representation is written to it instead,
+        see :meth:`write_set`.
+        """
+        if stream is not None:
+            return cls.write_set(dataset, stream, encoding=encoding, **kwargs)
         stream = cls.export_stream_set(dataset, **kwargs)
         return stream.getvalue()
 
     @classmethod
-    def import_set(cls, dset, in_stream, headers=True, skip_lines=0, **kwargs):
-        """Returns dataset from CSV stream."""
+    def write_set(cls, dataset, stream, encoding='utf-8', **kwargs):
+        """Writes CSV representation of Dataset to `stream`, a text stream or
+        a binary one (to which the text is written in `encoding`). Streams are
+        binary unless they are ``io.TextIOBase`` instances or have a ``mode``
+        without ``'b'``.
+
+        Rows are formatted and written in batches of ``BATCH_SIZE``, so that
+        the whole CSV representation is never held in memory.
+        """
+        kwargs.setdefault('delimiter', cls.DEFAULT_DELIMITER)
+
+        if _is_text(stream):
+            write = stream.write
+        else:
+            # An incremental encoder only emits a BOM before the first batch
+            encoder = codecs.getincrementalencoder(encoding)()
+
+            def write(text):
+                stream.write(encoder.encode(text))
+
+        buffer = StringIO()
+        _csv = csv.writer(buffer, **kwargs)
+        if dataset.headers:
+            _csv.writerow(dataset.headers)
+
+        rows = dataset.iterrows()
+        while True:
+            batch = list(islice(rows, cls.BATCH_SIZE))
+            if batch:
+                _csv.writerows(batch)
+            if buffer.tell():
+                write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+            if not batch:
+                break
+
+    @classmethod
+    def import_set(cls, dset, in_stream, headers=True, skip_lines=0, workers=None,
+                   infer_types=False, dtypes=None, usecols=None, nrows=None, skiprows=None,
+                   where=None, **kwargs):
+        """Returns dataset from CSV stream.
+
+        Only the `usecols` columns are kept, and reading stops after `nrows`
+        rows, the rows given by `skiprows` and the ones not kept by `where`
+        being skipped, see :func:`tablib.utils.select_rows`.
+
+        If `workers` is more than 1 and `in_stream` is a file on disk, the file
+        is parsed in that many processes, see :meth:`iter_parallel_rows`.
+
+        If `infer_types` is true, the values of each column are converted to
+        ``bool``, ``int``, ``float``, ``datetime.date`` or ``datetime.datetime``
+        if its first ``INFER_SAMPLE_SIZE`` non-empty values all look like one
+        of these types. `dtypes` is a ``{column: type}`` dictionary of the
+        columns to convert to the given types (or with the given callables)
+        instead. Values which can't be converted are kept as strings, and
+        empty values of converted columns become ``None``.
+        """
 
         dset.wipe()
 
+        rows = None
+        if workers and workers > 1:
+            rows = cls.iter_parallel_rows(
+                in_stream, workers, headers=headers, skip_lines=skip_lines, **kwargs
+            )
+        if rows is None:
+            rows = cls.iter_rows(in_stream, headers=headers, skip_lines=skip_lines, **kwargs)
+        header_row = next(rows, None) if headers else None
+        header_row, rows = select_rows(header_row, rows, usecols, nrows, skiprows, where)
+        if headers:
+            dset.headers = header_row
+        if infer_types or dtypes:
+            rows = cls._convert_types(dset, list(rows), infer_types, dtypes or {})
+        dset.extend(rows)
+
+    @classmethod
+    def _convert_types(cls, dset, rows, infer_types, dtypes):
+        """Converts the values of `rows` in place, column by column."""
+        if not rows:
+            return rows
+        converters = {}
+        if infer_types:
+            for pos in range(len(rows[0])):
+                values = filter(None, (row[pos] for row in rows))
+                sample = list(islice(values, cls.INFER_SAMPLE_SIZE))
+                converters[pos] = _infer_converter(sample)
+        for column, kind in dtypes.items():
+            converters[dset._column_pos(column)] = CONVERTERS.get(kind, kind)
+
+        for pos, convert in converters.items():
+            if convert is None:
+                continue
+            values = _convert([row[pos] for row in rows], convert)
+            for row, value in zip(rows, values):
+                row[pos] = value
+        return rows
+
+    @classmethod
+    def iter_rows(cls, in_stream, headers=True, skip_lines=0, **kwargs):
+        """Lazily yields the rows of a CSV stream as lists, the header row
+        first if `headers` is true. Empty lines are skipped, and short rows
+        are completed with empty strings."""
+
         kwargs.setdefault('delimiter', cls.DEFAULT_DELIMITER)
 
+        width = 0
         rows = csv.reader(in_stream, **kwargs)
         for i, row in enumerate(rows):
             if i < skip_lines:
                 continue
             if i == skip_lines and headers:
-                dset.headers = row
+                width = len(row)
+                yield row
             elif row:
-                if i > 0 and len(row) < dset.width:
-                    row += [''] * (dset.width - len(row))
-                dset.append(row)
+                if i > 0 and len(row) < width:
+                    row += [''] * (width - len(row))
+                width = width or len(row)
+                yield row
+
+    @classmethod
+    def iter_parallel_rows(cls, in_stream, workers, headers=True, skip_lines=0, **kwargs):
+        """Returns an iterator over the rows of a CSV file, as :meth:`iter_rows`
+        does, the file being split in byte ranges ending at record boundaries
+        which are parsed in `workers` processes, or None if it can't be split.
+
+        Record boundaries are found by counting quote characters, so
+        `in_stream` must be a seekable text file on disk, in an
+        ASCII-compatible encoding, and must not use an escape character or
+        ``csv.QUOTE_NONE``. It is read from its current position, and line
+        ends are translated as the stream itself does. As a quote character
+        within an unquoted value throws the count off, each range is checked
+        to end at a record boundary once parsed, the rest of the file being
+        parsed in a single process if one doesn't.
+        """
+
+        kwargs.setdefault('delimiter', cls.DEFAULT_DELIMITER)
+
+        path = getattr(in_stream, 'name', None)
+        if not isinstance(path, str) or not os_path.isfile(path) or not _is_text(in_stream):
+            return None
+        try:
+            position = in_stream.tell()
+        except OSError:
+            return None
+        # Positions of 2 ** 64 or more hold a decoder state rather than being
+        # byte offsets, and there's nothing left to split at the end of file.
+        if not 0 <= position < min(os_path.getsize(path), 1 << 64):
+            return None
+        dialect = csv.reader((), **kwargs).dialect
+        if dialect.escapechar is not None or dialect.quoting == csv.QUOTE_NONE:
+            return None
+        encoding = getattr(in_stream, 'encoding', None) or 'utf-8'
+        encoder = codecs.getincrementalencoder(encoding)()
+        encoder.encode(' ')
+        quote = encoder.encode(dialect.quotechar or '"')
+        if encoder.encode('\n') != b'\n' or len(quote) != 1:
+            return None
+        return cls._iter_parallel_rows(in_stream, position, encoding, quote, workers, headers,
+                                       skip_lines, kwargs)
+
+    @classmethod
+    def _iter_parallel_rows(cls, in_stream, position, encoding, quote, workers, headers,
+                            skip_lines, kwargs):
+        path = in_stream.name
+        with open(path, 'rb') as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            newline = _stream_newline(in_stream, buf, position)
+            start = position
+            for _ in range(skip_lines):
+                start = _record_end(buf, start, quote)
+            if headers:
+                start = _record_end(buf, start, quote)
+            text = buf[position:start].decode(encoding)
+            skipped, complete = _parse_records(text, kwargs, newline)
+            offsets = _split_records(buf, start, workers, quote)
+
+        if not complete or len(skipped) != skip_lines + bool(headers):
+            yield from cls.iter_rows(in_stream, headers=headers, skip_lines=skip_lines, **kwargs)
+            return
+
+        width = 0
+        if headers:
+            width = len(skipped[-1])
+            yield skipped[-1]
+
+        parse = partial(cls._parse_range, path, encoding, newline, kwargs)
+        with ProcessPoolExecutor(workers) as executor:
+            for start, (rows, complete) in zip(offsets, executor.map(parse, offsets, offsets[1:])):
+                if not complete:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    rows = cls._iter_range_rows(path, encoding, newline, kwargs, start)
+                for row in rows:
+                    if len(row) < width:
+                        row += [''] * (width - len(row))
+                    width = width or len(row)
+                    yield row
+                if not complete:
+                    break
+
+    @classmethod
+    def _parse_range(cls, path, encoding, newline, kwargs, start, end):
+        """Returns the non-empty rows of the bytes `start` to `end` of a CSV
+        file, and whether they end at a record boundary."""
+        with open(path, 'rb') as fh:
+            fh.seek(start)
+            text = fh.read(end - start).decode(encoding)
+        rows, complete = _parse_records(text, kwargs, newline)
+        return [row for row in rows if row], complete
+
+    @classmethod
+    def _iter_range_rows(cls, path, encoding, newline, kwargs, start):
+        """Lazily yields the non-empty rows of a CSV file from byte `start` on."""
+        with open(path, 'rb') as fh:
+            fh.seek(start)
+            with TextIOWrapper(fh, encoding, newline=newline) as text:
+                yield from filter(None, csv.reader(text, **kwargs))
 
     @classmethod
     def detect(cls, stream, delimiter=None):
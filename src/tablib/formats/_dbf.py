@@ -5,6 +5,7 @@ __lazy_modules__ = {
     "io",
     "os",
     "tablib._vendor",
+    "tablib.utils",
     "tempfile",
 }
 
@@ -14,6 +15,7 @@ import tempfile
 
 from .._vendor.dbfpy import dbf, dbfnew
 from .._vendor.dbfpy import record as dbfrecord
+from ..utils import select_rows
 
 
 class DBFFormat:
@@ -54,15 +56,31 @@ class DBFFormat:
         return stream.getvalue()
 
     @classmethod
-    def import_set(cls, dset, in_stream):
-        """Returns a dataset from a DBF stream."""
+    def import_set(cls, dset, in_stream, usecols=None, nrows=None, skiprows=None, where=None):
+        """Returns a dataset from a DBF stream.
+
+        Only the `usecols` columns are kept, and reading stops after `nrows`
+        records, the records given by `skiprows` and the ones not kept by
+        `where` being skipped, see :func:`tablib.utils.select_rows`.
+        """
 
         dset.wipe()
+        rows = cls.iter_rows(in_stream)
+        header_row, rows = select_rows(next(rows), rows, usecols, nrows, skiprows, where)
+        dset.headers = header_row
+        for row in rows:
+            dset.append(row)
+
+    @classmethod
+    def iter_rows(cls, in_stream, headers=True):
+        """Lazily yields the records of a DBF stream as lists, preceded by
+        the field names if `headers` is true."""
+
         _dbf = dbf.Dbf(in_stream)
-        dset.headers = _dbf.fieldNames
+        if headers:
+            yield _dbf.fieldNames
         for record in range(_dbf.recordCount):
-            row = [_dbf[record][f] for f in _dbf.fieldNames]
-            dset.append(row)
+            yield [_dbf[record][f] for f in _dbf.fieldNames]
 
     @classmethod
     def detect(cls, stream):
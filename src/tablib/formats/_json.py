@@ -1,7 +1,7 @@
 """ Tablib - JSON Support
 """
 
-__lazy_modules__ = {"decimal", "json", "uuid"}
+__lazy_modules__ = {"decimal", "json", "tablib.utils", "uuid"}
 
 import decimal
 import json
@@ -9,6 +9,8 @@ from uuid import UUID
 
 import tablib
 
+from ..utils import row_predicate
+
 
 def serialize_objects_handler(obj):
     if isinstance(obj, (decimal.Decimal, UUID)):
@@ -38,11 +40,24 @@ class JSONFormat:
         )
 
     @classmethod
-    def import_set(cls, dset, in_stream):
-        """Returns dataset from JSON stream."""
+    def import_set(cls, dset, in_stream, where=None):
+        """Returns dataset from JSON stream.
+
+        Rows not kept by `where` are skipped, see :func:`tablib.utils.row_predicate`.
+        """
 
         dset.wipe()
-        dset.dict = json.load(in_stream)
+        rows = json.load(in_stream)
+        if where is not None and rows and isinstance(rows, list):
+            header_row = list(rows[0]) if isinstance(rows[0], dict) else None
+            keep = row_predicate(where, header_row)
+            if header_row is None:
+                rows = [row for row in rows if keep(row)]
+            else:
+                rows = [row for row in rows if keep(list(row.values()))]
+                if not rows:
+                    dset.headers = header_row
+        dset.dict = rows
 
     @classmethod
     def import_book(cls, dbook, in_stream):
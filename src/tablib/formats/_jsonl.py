@@ -0,0 +1,68 @@
+""" Tablib - JSON Lines Support
+"""
+
+__lazy_modules__ = {"itertools", "json", "tablib.formats._json"}
+
+import json
+from itertools import islice
+
+from ._json import serialize_objects_handler
+
+
+class JSONLinesFormat:
+    title = 'jsonl'
+    extensions = ('jsonl', 'ndjson')
+
+    @classmethod
+    def export_set(cls, dataset):
+        """Returns JSON Lines representation of Dataset: one JSON object per
+        row if headers have been set, one JSON list otherwise."""
+        return ''.join(
+            json.dumps(row, default=serialize_objects_handler, ensure_ascii=False) + '\n'
+            for row in dataset.iterdicts()
+        )
+
+    @classmethod
+    def import_set(cls, dset, in_stream, headers=True):
+        """Returns dataset from JSON Lines stream."""
+
+        dset.wipe()
+
+        rows = cls.iter_rows(in_stream, headers=headers)
+        if headers:
+            dset.headers = next(rows, None)
+        dset.extend(rows)
+
+    @classmethod
+    def iter_rows(cls, in_stream, headers=True):
+        """Lazily yields the rows of a JSON Lines stream as lists, the header
+        row first if `headers` is true.
+
+        If the lines are JSON objects, the keys of the first one are the
+        headers, and keys missing from the next ones get ``None`` values. If
+        they are lists, the first one is the header row if `headers` is true.
+        """
+
+        keys = None
+        for line in in_stream:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if isinstance(row, dict):
+                if keys is None:
+                    keys = list(row)
+                    if headers:
+                        yield keys
+                row = [row.get(key) for key in keys]
+            yield row
+
+    @classmethod
+    def detect(cls, stream):
+        """Returns True if the first lines of the stream are JSON objects or lists."""
+        try:
+            lines = [line for line in islice(stream, 10) if line.strip()]
+            return bool(lines) and all(
+                isinstance(json.loads(line), (dict, list)) for line in lines
+            )
+        except (TypeError, ValueError):
+            return False
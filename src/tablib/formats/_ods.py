@@ -1,7 +1,7 @@
 """ Tablib - ODF Support.
 """
 
-__lazy_modules__ = {"datetime", "io", "numbers"}
+__lazy_modules__ = {"datetime", "io", "numbers", "tablib.utils"}
 
 import datetime as dt
 import numbers
@@ -11,6 +11,8 @@ from odf import number, opendocument, style, table, text
 
 import tablib
 
+from ..utils import select_rows
+
 bold = style.Style(name="bold", family="paragraph")
 bold.addElement(style.TextProperties(
     fontweight="bold",
@@ -107,28 +109,49 @@ class ODSFormat:
         return stream.getvalue()
 
     @classmethod
-    def import_sheet(cls, dset, sheet, headers=True, skip_lines=0):
-        """Populate dataset `dset` with sheet data."""
+    def import_sheet(cls, dset, sheet, headers=True, skip_lines=0, usecols=None, nrows=None,
+                     skiprows=None, where=None):
+        """Populate dataset `dset` with sheet data.
+
+        Only the `usecols` columns are kept, and reading stops after `nrows`
+        rows, the rows given by `skiprows` and the ones not kept by `where`
+        being skipped, see :func:`tablib.utils.select_rows`.
+        """
 
         dset.title = sheet.getAttribute('name')
 
+        rows = cls._sheet_rows(sheet, headers, skip_lines)
+        header_row = next(rows, None) if headers else None
+        header_row, rows = select_rows(header_row, rows, usecols, nrows, skiprows, where)
+        if header_row:
+            dset.headers = header_row
+        for row_vals in rows:
+            dset.append(row_vals)
+
+    @classmethod
+    def _sheet_rows(cls, sheet, headers=True, skip_lines=0):
+        """Yields the values of the non-empty rows of the sheet, the header row
+        first if `headers` is true (None if it is empty), completing short rows
+        with empty strings."""
+
         def is_real_cell(cell):
             return cell.hasChildNodes() or not cell.getAttribute('numbercolumnsrepeated')
 
         rows = (row for row in sheet.childNodes if row.tagName == "table:table-row")
 
+        width = 0
         for i, row in enumerate(rows):
             if i < skip_lines:
                 continue
             row_vals = [cls.read_cell(cell) for cell in row.childNodes if is_real_cell(cell)]
-            if not row_vals:
-                continue
             if i == skip_lines and headers:
-                dset.headers = row_vals
-            else:
-                if i > skip_lines and len(row_vals) < dset.width:
-                    row_vals += [''] * (dset.width - len(row_vals))
-                dset.append(row_vals)
+                width = len(row_vals)
+                yield row_vals or None
+            elif row_vals:
+                if len(row_vals) < width:
+                    row_vals += [''] * (width - len(row_vals))
+                width = width or len(row_vals)
+                yield row_vals
 
     @classmethod
     def read_cell(cls, cell, value_type=None):
@@ -173,7 +196,8 @@ class ODSFormat:
             return cls.read_cell(subnode, value_type)
 
     @classmethod
-    def import_set(cls, dset, in_stream, headers=True, skip_lines=0):
+    def import_set(cls, dset, in_stream, headers=True, skip_lines=0, usecols=None, nrows=None,
+                   skiprows=None, where=None):
         """Populate dataset `dset` from ODS stream."""
 
         dset.wipe()
@@ -181,7 +205,8 @@ class ODSFormat:
         ods_book = opendocument.load(in_stream)
         for sheet in ods_book.spreadsheet.childNodes:
             if sheet.qname[1] == 'table':
-                cls.import_sheet(dset, sheet, headers, skip_lines)
+                cls.import_sheet(dset, sheet, headers, skip_lines, usecols, nrows, skiprows,
+                                 where)
 
     @classmethod
     def import_book(cls, dbook, in_stream, headers=True):
@@ -47,9 +47,8 @@ class ReSTFormat:
         else:
             column_lengths = [[] for _ in range(dataset.width)]
             word_lens = [0 for _ in range(dataset.width)]
-        for row in dataset.dict:
-            values = iter(row.values() if hasattr(row, 'values') else row)
-            for i, val in enumerate(values):
+        for row in dataset.iterrows():
+            for i, val in enumerate(row):
                 text = to_str(val)
                 column_lengths[i].append(len(text))
                 word_lens[i] = max(word_lens[i], _max_word_len(text))
@@ -129,9 +128,8 @@ class ReSTFormat:
                 justify=JUSTIFY_CENTER,
             ))
             lines.append(border)
-        for row in dataset.dict:
-            values = iter(row.values() if hasattr(row, 'values') else row)
-            lines.extend(cls._row_to_lines(values, column_widths, wrapper, ''))
+        for row in dataset.iterrows():
+            lines.extend(cls._row_to_lines(row, column_widths, wrapper, ''))
         lines.append(border)
         return '\n'.join(lines)
 
@@ -181,9 +179,8 @@ class ReSTFormat:
                 justify=JUSTIFY_CENTER,
             ))
             lines.append(header_sep)
-        for row in dataset.dict:
-            values = iter(row.values() if hasattr(row, 'values') else row)
-            lines.extend(cls._row_to_lines(values, column_widths, wrapper))
+        for row in dataset.iterrows():
+            lines.extend(cls._row_to_lines(row, column_widths, wrapper))
             lines.append(row_sep)
         return '\n'.join(lines)
 
@@ -241,7 +238,7 @@ class ReSTFormat:
         True
 
         """
-        if not dataset.dict:
+        if not dataset:
             return ''
         force_grid = kwargs.get('force_grid', False)
         max_table_width = kwargs.get('max_table_width', cls.MAX_TABLE_WIDTH)
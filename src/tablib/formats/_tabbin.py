@@ -0,0 +1,255 @@
+""" Tablib - tabbin (native binary columnar format) Support.
+
+A tabbin file starts with a magic string and the length of a JSON header
+holding the title, headers and height of the dataset, and the type and
+``[offset, length]`` of each column block in the data section that follows.
+Blocks of ``int``, ``float`` and ``bool`` columns are raw little-endian
+arrays, other columns are JSON lists, and dictionary-encoded columns are an
+array of codes with a JSON list of their categories.
+"""
+
+__lazy_modules__ = {
+    "array",
+    "base64",
+    "datetime",
+    "decimal",
+    "functools",
+    "io",
+    "json",
+    "mmap",
+    "os",
+    "sys",
+    "tablib.core",
+}
+
+import json
+import mmap
+import os
+from array import array
+from base64 import b64decode, b64encode
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import partial
+from io import UnsupportedOperation
+from sys import byteorder
+
+from ..core import (
+    TYPECODES,
+    BoolArray,
+    CategoricalColumn,
+    ColumnStore,
+    LazyColumns,
+    _column_type,
+    _fits,
+    _typed_column,
+)
+
+MAGIC = b'TABBIN\x00\x01'
+
+# Cell types JSON has no representation for: (type, encode, decode), in the
+# order they are checked
+VALUE_TYPES = {
+    'datetime': (datetime, datetime.isoformat, datetime.fromisoformat),
+    'date': (date, date.isoformat, date.fromisoformat),
+    'time': (time, time.isoformat, time.fromisoformat),
+    'decimal': (Decimal, str, Decimal),
+    'bytes': (bytes, lambda value: b64encode(value).decode('ascii'), b64decode),
+}
+KINDS = {'int': int, 'float': float, 'bool': bool}
+
+
+def _encode(value):
+    """Returns `value` as JSON data, tagging the values JSON has no exact
+    representation for: tuples, dicts with a ``$tablib`` key or keys which
+    are not strings, and the types of ``VALUE_TYPES``."""
+    kind = value.__class__
+    if value is None or kind in (str, int, float, bool):
+        return value
+    elif kind is list:
+        return [_encode(item) for item in value]
+    elif kind is tuple:
+        return {'$tablib': 'tuple', 'value': [_encode(item) for item in value]}
+    elif kind is dict:
+        if '$tablib' in value or not all(key.__class__ is str for key in value):
+            pairs = [[_encode(key), _encode(item)] for key, item in value.items()]
+            return {'$tablib': 'dict', 'value': pairs}
+        return {key: _encode(item) for key, item in value.items()}
+    for name, (type_, encode, _) in VALUE_TYPES.items():
+        if isinstance(value, type_):
+            return {'$tablib': name, 'value': encode(value)}
+    raise TypeError(f'{value!r} cannot be stored in the tabbin format.')
+
+
+def _decode_value(obj):
+    if len(obj) == 2 and '$tablib' in obj and 'value' in obj:
+        name, value = obj['$tablib'], obj['value']
+        if name == 'tuple':
+            return tuple(value)
+        elif name == 'dict':
+            return dict(value)
+        return VALUE_TYPES[name][2](value)
+    return obj
+
+
+def _dumps(value):
+    return json.dumps(_encode(value), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data):
+    return json.loads(bytes(data), object_hook=_decode_value)
+
+
+def _array_bytes(values):
+    if byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_array(cls, typecode, data):
+    values = cls(typecode)
+    values.frombytes(data)
+    if byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+class TabbinFormat:
+    title = 'tabbin'
+    extensions = ('tabbin',)
+
+    @classmethod
+    def export_set(cls, dataset):
+        """Returns the tabbin representation of a Dataset, as bytes."""
+        blocks = []
+        size = 0
+
+        def add(data):
+            nonlocal size
+            # Blocks start on 8 bytes boundaries, as arrays would in memory.
+            padding = -len(data) % 8
+            blocks.append(data + b'\0' * padding)
+            block = [size, len(data)]
+            size += len(data) + padding
+            return block
+
+        specs = [cls._column_spec(col, add) for col in cls._columns(dataset)]
+        if isinstance(dataset._data, ColumnStore):
+            tags = dataset._data.tags
+        else:
+            tags = [row.tags for row in dataset._data]
+        header = _dumps({
+            'title': dataset.title,
+            'headers': dataset.headers,
+            'height': dataset.height,
+            'columns': specs,
+            'tags': add(_dumps(tags)) if any(tags) else None,
+        })
+        header += b' ' * (-len(header) % 8)
+        return b''.join([MAGIC, len(header).to_bytes(8, 'little'), header, *blocks])
+
+    @classmethod
+    def _columns(cls, dataset):
+        """Returns the columns to store, with the formatters applied."""
+        if dataset._formatters:
+            rows = dataset._formatted_rows()
+            return list(map(list, zip(*rows))) if dataset.height else [[]] * dataset.width
+        if dataset._columnar and len(dataset._data.columns) == dataset.width:
+            return dataset._data.columns
+        return [dataset.get_col(pos) for pos in range(dataset.width)]
+
+    @classmethod
+    def _column_spec(cls, col, add):
+        kind = _column_type(col)
+        if kind is None and len(col):
+            kind = type(col[0])
+            if kind not in TYPECODES or not _fits(kind, col):
+                kind = None
+
+        if kind == 'category':
+            return {
+                'type': 'category',
+                'typecode': col.codes.typecode,
+                'block': add(_array_bytes(col.codes)),
+                'categories': add(_dumps(col.categories)),
+            }
+        elif kind is not None:
+            if isinstance(col, list):
+                col = _typed_column(kind, col)
+            return {'type': kind.__name__, 'block': add(_array_bytes(col))}
+        return {'type': 'object', 'block': add(_dumps(list(col)))}
+
+    @classmethod
+    def import_set(cls, dset, in_stream):
+        """Loads a tabbin file or stream into the Dataset.
+
+        Files (given as path objects or opened in binary mode) are mapped in
+        memory, and each column is only decoded on its first access.
+        """
+        buffer = memoryview(cls._map(in_stream))
+        if bytes(buffer[:len(MAGIC)]) != MAGIC:
+            raise ValueError('The stream is not in the tabbin format.')
+        header_size = int.from_bytes(buffer[len(MAGIC):len(MAGIC) + 8], 'little')
+        start = len(MAGIC) + 8
+        header = _loads(buffer[start:start + header_size])
+        data = buffer[start + header_size:]
+
+        def block(offset_length):
+            offset, length = offset_length
+            return data[offset:offset + length]
+
+        columns = LazyColumns(
+            partial(cls._read_column, spec, block) for spec in header['columns']
+        )
+        store = ColumnStore.from_columns(columns, header['height'])
+        if header['tags'] is not None:
+            store.tags = [tuple(tags) for tags in _loads(block(header['tags']))]
+
+        dset.wipe()
+        dset._storage = 'columnar'
+        dset._data = store
+        dset.headers = header['headers']
+        dset.title = header['title']
+
+    @classmethod
+    def _read_column(cls, spec, block):
+        kind = spec['type']
+        if kind == 'object':
+            return _loads(block(spec['block']))
+        elif kind == 'category':
+            column = CategoricalColumn()
+            column.codes = _read_array(array, spec['typecode'], block(spec['block']))
+            column.categories = _loads(block(spec['categories']))
+            column.lookup = {
+                (value.__class__, value): code for code, value in enumerate(column.categories)
+            }
+            return column
+        kind = KINDS[kind]
+        return _read_array(
+            BoolArray if kind is bool else array, TYPECODES[kind], block(spec['block'])
+        )
+
+    @classmethod
+    def _map(cls, in_stream):
+        """Returns the content of `in_stream`, mapped in memory if it is a file."""
+        if isinstance(in_stream, os.PathLike):
+            with open(in_stream, 'rb') as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return mmap.mmap(in_stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, UnsupportedOperation, ValueError):
+            content = in_stream.read()
+        if isinstance(content, str):
+            raise TypeError(
+                'The tabbin format is binary, load it from bytes, a binary stream or '
+                'a path object (such as pathlib.Path), not from a str.'
+            )
+        return content
+
+    @classmethod
+    def detect(cls, stream):
+        """Returns True if the given stream is in the tabbin format."""
+        try:
+            return stream.read(len(MAGIC)) == MAGIC
+        except Exception:
+            return False
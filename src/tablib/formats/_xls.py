@@ -1,7 +1,7 @@
 """ Tablib - XLS Support.
 """
 
-__lazy_modules__ = {"datetime", "io", "xlrd", "xlrd.xldate"}
+__lazy_modules__ = {"datetime", "io", "tablib.utils", "xlrd", "xlrd.xldate"}
 
 import datetime
 import re
@@ -13,6 +13,8 @@ from xlrd.xldate import xldate_as_datetime
 
 import tablib
 
+from ..utils import row_predicate
+
 # special styles
 wrap = xlwt.easyxf("alignment: wrap on")
 bold = xlwt.easyxf("font: bold on")
@@ -93,8 +95,11 @@ class XLSFormat:
         return stream.getvalue()
 
     @classmethod
-    def import_set(cls, dset, in_stream, headers=True, skip_lines=0):
-        """Returns databook from XLS stream."""
+    def import_set(cls, dset, in_stream, headers=True, skip_lines=0, where=None):
+        """Returns databook from XLS stream.
+
+        Rows not kept by `where` are skipped, see :func:`tablib.utils.row_predicate`.
+        """
 
         dset.wipe()
 
@@ -110,16 +115,21 @@ class XLSFormat:
                 return xldate_as_datetime(value, xls_book.datemode)
             return value
 
+        keep = None
         for i in range(sheet.nrows):
             if i < skip_lines:
                 continue
             if i == skip_lines and headers:
                 dset.headers = sheet.row_values(i)
             else:
-                dset.append([
+                if keep is None and where is not None:
+                    keep = row_predicate(where, dset.headers)
+                row_vals = [
                     cell_value(val, typ)
                     for val, typ in zip(sheet.row_values(i), sheet.row_types(i))
-                ])
+                ]
+                if keep is None or keep(row_vals):
+                    dset.append(row_vals)
 
     @classmethod
     def import_book(cls, dbook, in_stream, headers=True):
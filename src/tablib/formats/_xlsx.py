@@ -9,6 +9,7 @@ __lazy_modules__ = {
     "openpyxl.styles",
     "openpyxl.utils",
     "openpyxl.workbook",
+    "tablib.utils",
 }
 
 import re
@@ -21,6 +22,8 @@ from openpyxl.workbook import Workbook
 
 import tablib
 
+from ..utils import select_rows
+
 INVALID_TITLE_REGEX = re.compile(r'[\\*?:/\[\]]')
 
 
@@ -108,31 +111,63 @@ class XLSXFormat:
         return stream.getvalue()
 
     @classmethod
-    def import_sheet(cls, dset, sheet, headers=True, skip_lines=0):
-        """Populates dataset with sheet."""
+    def import_sheet(cls, dset, sheet, headers=True, skip_lines=0, usecols=None, nrows=None,
+                     skiprows=None, where=None):
+        """Populates dataset with sheet.
+
+        Only the `usecols` columns are kept, and reading stops after `nrows`
+        rows, the rows given by `skiprows` and the ones not kept by `where`
+        being skipped, see :func:`tablib.utils.select_rows`.
+        """
 
         dset.title = sheet.title
 
+        rows = cls._sheet_rows(sheet, skip_lines)
+        header_row = next(rows, None) if headers else None
+        header_row, rows = select_rows(header_row, rows, usecols, nrows, skiprows, where)
+        if headers:
+            dset.headers = header_row
+        for row_vals in rows:
+            dset.append(row_vals)
+
+    @classmethod
+    def _sheet_rows(cls, sheet, skip_lines=0):
+        """Yields the values of the rows of the sheet after the first
+        `skip_lines` ones, completing rows shorter than the first one with
+        empty strings."""
+
+        width = 0
         for i, row in enumerate(sheet.rows):
             if i < skip_lines:
                 continue
             row_vals = [c.value for c in row]
-            if i == skip_lines and headers:
-                dset.headers = row_vals
-            else:
-                if i > skip_lines and len(row_vals) < dset.width:
-                    row_vals += [''] * (dset.width - len(row_vals))
-                dset.append(row_vals)
+            if i > skip_lines and len(row_vals) < width:
+                row_vals += [''] * (width - len(row_vals))
+            width = width or len(row_vals)
+            yield row_vals
 
     @classmethod
-    def import_set(cls, dset, in_stream, headers=True, read_only=True, skip_lines=0):
+    def import_set(cls, dset, in_stream, headers=True, read_only=True, skip_lines=0,
+                   usecols=None, nrows=None, skiprows=None, where=None):
         """Returns databook from XLS stream."""
 
         dset.wipe()
 
         xls_book = load_workbook(in_stream, read_only=read_only, data_only=True)
         sheet = xls_book.active
-        cls.import_sheet(dset, sheet, headers, skip_lines)
+        cls.import_sheet(dset, sheet, headers, skip_lines, usecols, nrows, skiprows,
+                         where)
+
+    @classmethod
+    def iter_rows(cls, in_stream, headers=True, read_only=True, skip_lines=0):
+        """Lazily yields the values of the rows of the active sheet of a XLSX
+        stream as lists, the header row first if `headers` is true."""
+
+        xls_book = load_workbook(in_stream, read_only=read_only, data_only=True)
+        try:
+            yield from cls._sheet_rows(xls_book.active, skip_lines)
+        finally:
+            xls_book.close()
 
     @classmethod
     def import_book(cls, dbook, in_stream, headers=True, read_only=True):
@@ -1,6 +1,9 @@
-__lazy_modules__ = {"io"}
+__lazy_modules__ = {"io", "itertools", "tablib.exceptions"}
 
 from io import BytesIO, StringIO
+from itertools import islice
+
+from .exceptions import HeadersNeeded
 
 
 def normalize_input(stream):
@@ -13,3 +16,62 @@ def normalize_input(stream):
     elif isinstance(stream, bytes):
         return BytesIO(stream)
     return stream
+
+
+def select_rows(header_row, rows, usecols=None, nrows=None, skiprows=None, where=None):
+    """
+    Return the `header_row` list and an iterator over the `rows` iterable,
+    both restricted to the `usecols` columns, given by header or by index, in
+    that order. The iterator skips the rows given by `skiprows`, a number of
+    rows or a collection of row indexes, and the rows not kept by `where` (see
+    :func:`row_predicate`), and stops after `nrows` rows, so that the rest of
+    `rows` is never read.
+    """
+    if skiprows:
+        if isinstance(skiprows, int):
+            rows = islice(rows, skiprows, None)
+        else:
+            skipped = set(skiprows)
+            rows = (row for i, row in enumerate(rows) if i not in skipped)
+    if where is not None:
+        rows = filter(row_predicate(where, header_row), rows)
+    if nrows is not None:
+        rows = islice(rows, nrows)
+    if usecols is not None:
+        positions = [_column_position(header_row, column) for column in usecols]
+        if header_row is not None:
+            header_row = [header_row[pos] for pos in positions]
+        rows = ([row[pos] for pos in positions] for row in rows)
+    return header_row, rows
+
+
+def row_predicate(where, header_row):
+    """
+    Return a function telling whether a row, a list of values, is kept by
+    `where`. It is either a callable, called with the row as a
+    ``{header: value}`` dictionary (or a list of values if `header_row` is
+    None) and returning whether it is kept, or a ``{column: value}``
+    dictionary of the values that the columns, given by header or by index,
+    must be equal to.
+    """
+    if callable(where):
+        if header_row is None:
+            return where
+        return lambda row: where(dict(zip(header_row, row)))
+    if not isinstance(where, dict):
+        raise TypeError('where must be a callable or a {column: value} dictionary.')
+    conditions = [
+        (_column_position(header_row, column), value) for column, value in where.items()
+    ]
+    return lambda row: all(row[pos] == value for pos, value in conditions)
+
+
+def _column_position(header_row, column):
+    if not isinstance(column, str):
+        return column
+    if header_row is None:
+        raise HeadersNeeded()
+    try:
+        return header_row.index(column)
+    except ValueError:
+        raise KeyError(column) from None
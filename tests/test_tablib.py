@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """Tests for Tablib."""
 
+import copy
 import datetime as dt
 import doctest
 import json
@@ -8,9 +9,12 @@ import pickle
 import re
 import tempfile
 import unittest
+from collections import namedtuple
 from decimal import Decimal
+from functools import partial
 from io import BytesIO, StringIO
 from pathlib import Path
+from unittest import mock
 from uuid import uuid4
 
 import xlrd
@@ -19,7 +23,7 @@ from openpyxl.reader.excel import load_workbook
 
 import tablib
 from tablib.core import Row, detect_format
-from tablib.exceptions import UnsupportedFormat
+from tablib.exceptions import DuplicateKey, HeadersNeeded, UnsupportedFormat
 from tablib.formats import registry
 
 try:
@@ -229,6 +233,57 @@ class TablibTestCase(BaseTestCase):
             ['JA', 'GW', 'TJ', 'SO', 'OS', 'AD']
         )
 
+    def test_extend(self):
+        """Rows are added in one batch, with dynamic columns filled in."""
+        self.founders.append_col(lambda row: row[0][0], header='initial')
+        self.founders.extend([('Some', 'One', 71), ('Other', 'Second', 84, 'X')], tags=['new'])
+
+        self.assertEqual(
+            self.founders[3:], [('Some', 'One', 71, 'S'), ('Other', 'Second', 84, 'X')]
+        )
+        self.assertEqual(self.founders.filter('new').height, 2)
+
+        with self.assertRaises(tablib.InvalidDimensions):
+            self.founders.extend([('Good', 'Row', 1), ('Bad', 'Row')])
+        self.assertEqual(self.founders.height, 5)
+
+    def test_extend_empty_dataset(self):
+        data.extend(iter([(1, 2), (3, 4)]))
+        self.assertEqual(data[:], [(1, 2), (3, 4)])
+        with self.assertRaises(tablib.InvalidDimensions):
+            data.extend([(1, 2, 3)])
+
+    def test_from_rows(self):
+        rows = [['John', 'Adams', 90], ['George', 'Washington', 67]]
+        dset = tablib.Dataset.from_rows(rows, headers=self.headers, title='Founders', copy=False)
+        self.assertEqual(dset.title, 'Founders')
+        self.assertEqual(dset['gpa'], [90, 67])
+        self.assertIs(dset._data[0]._row, rows[0])
+
+        dset = tablib.Dataset.from_rows(rows, headers=self.headers)
+        self.assertIsNot(dset._data[0]._row, rows[0])
+
+        dset = tablib.Dataset.from_rows(iter(rows), storage='columnar')
+        self.assertEqual(dset[1], ('George', 'Washington', 67))
+
+        with self.assertRaises(tablib.InvalidDimensions):
+            tablib.Dataset.from_rows([['John', 90]], headers=self.headers)
+
+    def test_from_columns(self):
+        gpas = [90, 67]
+        dset = tablib.Dataset.from_columns(
+            {'first_name': ['John', 'George'], 'gpa': gpas}, copy=False
+        )
+        self.assertEqual(dset.headers, ['first_name', 'gpa'])
+        self.assertEqual(dset[:], [('John', 90), ('George', 67)])
+        self.assertIs(dset._data.columns[1], gpas)
+
+        dset = tablib.Dataset.from_columns({'gpa': (90, 67)}, storage='rows')
+        self.assertEqual(dset.dict, [{'gpa': 90}, {'gpa': 67}])
+
+        with self.assertRaises(tablib.InvalidDimensions):
+            tablib.Dataset.from_columns({'a': [1, 2], 'b': [1]})
+
     def test_header_slicing(self):
         """Verify slicing by headers."""
 
@@ -322,6 +377,22 @@ class TablibTestCase(BaseTestCase):
         # Delete from invalid index
         self.assertRaises(IndexError, self.founders.__delitem__, 3)
 
+    def test_header_lookup_follows_column_changes(self):
+        """Name lookups stay correct as columns are added, removed or renamed."""
+        self.founders.insert_col(0, [1, 2, 3], header='id')
+        self.assertEqual(self.founders['gpa'], [90, 67, 50])
+        del self.founders['first_name']
+        self.assertEqual(self.founders['last_name'], ['Adams', 'Washington', 'Jefferson'])
+        self.founders.headers[0] = 'key'
+        self.assertEqual(self.founders['key'], [1, 2, 3])
+        with self.assertRaises(KeyError):
+            self.founders['id']
+
+    def test_header_lookup_duplicate_headers(self):
+        """The first column wins when headers are duplicated."""
+        data = tablib.Dataset((1, 2), headers=['a', 'a'])
+        self.assertEqual(data['a'], [1])
+
     def test_getitem_str_key_no_headers_raises(self):
         """Verify that accessing by column name on a headerless Dataset raises HeadersNeeded."""
         d = tablib.Dataset()
@@ -557,6 +628,127 @@ class TablibTestCase(BaseTestCase):
         self.assertEqual(second_row, expected_second)
         self.assertEqual(third_row, expected_third)
 
+    def test_sorting_multiple_columns(self):
+        data = tablib.Dataset(headers=['name', 'team', 'score'])
+        data.append(('a', 'x', 2), tags=['first'])
+        data.append(('b', 'y', 1))
+        data.append(('c', 'x', 3))
+        data.append(('d', 'y', 1))
+
+        sorted_data = data.sort(['team', 'score'], reverse=[False, True])
+        self.assertEqual(sorted_data['name'], ['c', 'a', 'b', 'd'])
+        self.assertEqual(sorted_data.filter('first')['name'], ['a'])
+
+        self.assertEqual(data.sort(2, key=lambda score: -score)['name'], ['c', 'a', 'b', 'd'])
+        self.assertEqual(
+            data.sort(key=lambda row: row[2] - len(row[1]))['name'], ['b', 'd', 'a', 'c']
+        )
+        self.assertEqual(data['name'], ['a', 'b', 'c', 'd'])
+
+        with self.assertRaises(ValueError):
+            data.sort(['team', 'score'], reverse=[True])
+        with self.assertRaises(TypeError):
+            data.sort()
+
+    def test_sorting_inplace(self):
+        self.founders.add_formatter('gpa', str)
+        self.assertIsNone(self.founders.sort('gpa', inplace=True))
+        self.assertEqual(self.founders['first_name'], ['Thomas', 'George', 'John'])
+        self.assertEqual(self.founders.dict[0]['gpa'], '50')
+
+    def test_join(self):
+        facts = tablib.Dataset(headers=['id', 'country', 'amount'])
+        facts.extend([(1, 'fr', 10), (2, 'de', 20), (3, 'fr', 30), (4, 'it', 40)])
+        countries = tablib.Dataset(headers=['country', 'name', 'id'])
+        countries.extend([('fr', 'France', 'x'), ('de', 'Germany', 'y'), ('es', 'Spain', 'z')])
+
+        for method in ('hash', 'merge'):
+            left, right = facts, countries
+            if method == 'merge':
+                left, right = facts.sort('country'), countries.sort('country')
+            joined = left.join(right, on='country', method=method)
+            self.assertEqual(joined.headers, ['id', 'country', 'amount', 'name', 'id_right'])
+            self.assertEqual(sorted(joined['amount']), [10, 20, 30])
+            self.assertEqual(joined.height, 3)
+
+            outer = left.join(right, on=['country'], how='outer', method=method)
+            self.assertEqual(outer.height, 5)
+            self.assertEqual(outer[-1], (None, 'es', None, 'Spain', 'z'))
+            self.assertIn((4, 'it', 40, None, None), outer)
+
+        # The smaller side is hashed either way, rows keep the left order.
+        left = countries.join(facts, on='country', how='left')
+        self.assertEqual(left['amount'], [10, 30, 20, None])
+
+        with self.assertRaises(ValueError):
+            facts.join(countries, on='country', method='merge')
+        with self.assertRaises(ValueError):
+            facts.join(countries, on='country', how='cross')
+
+    def test_group_by(self):
+        data = tablib.Dataset(headers=['country', 'city', 'amount'])
+        data.extend([
+            ('fr', 'Paris', 10), ('de', 'Berlin', 20), ('fr', 'Lyon', 30), ('fr', 'Paris', None),
+        ])
+
+        totals = data.group_by('country').agg({'amount': ['sum', 'mean', len], 'city': 'count'})
+        self.assertEqual(
+            totals.headers, ['country', 'amount_sum', 'amount_mean', 'amount_len', 'city'],
+        )
+        self.assertEqual(totals[0], ('fr', 40, 20, 3, 3))
+        self.assertEqual(totals[1], ('de', 20, 20, 1, 1))
+
+        cities = data.group_by(['country', 'city']).agg({'amount': 'min', 1: len})
+        self.assertEqual(cities.dict[0], {'country': 'fr', 'city': 'Paris', 'amount': 10, 1: 2})
+        self.assertEqual(cities.height, 3)
+
+        # Callables without a __name__ only need one when suffixing headers.
+        reverse_sorted = partial(sorted, reverse=True)
+        cities = data.group_by('country').agg({'city': reverse_sorted})
+        self.assertEqual(cities['city'], [['Paris', 'Paris', 'Lyon'], ['Berlin']])
+        cities = data.group_by('country').agg({'city': ['count', reverse_sorted]})
+        self.assertEqual(cities.headers[1:], ['city_count', f'city_{reverse_sorted!r}'])
+
+        with self.assertRaises(ValueError):
+            data.group_by('country').agg({'amount': 'median'})
+        with self.assertRaises(KeyError):
+            data.group_by('region').agg({'amount': 'sum'})
+
+    def test_column_indexes(self):
+        for storage in tablib.core.STORAGES:
+            data = tablib.Dataset(headers=['id', 'name'], storage=storage)
+            data.extend([(1, 'a'), (2, 'b'), (3, 'a')])
+            data.create_index('id', unique=True)
+            data.create_index('name')
+            self.assertEqual(data.lookup('name', 'a'), [(1, 'a'), (3, 'a')])
+
+            data.lpush((0, 'a'))
+            data.append((4, 'c'))
+            data[1] = (1, 'c')
+            self.assertEqual(data.lpop(), (0, 'a'))
+            self.assertEqual(data.rpop(), (4, 'c'))
+            self.assertEqual(data.lookup('name', 'a'), [(3, 'a')])
+            self.assertEqual(data.lookup('id', 1), [(1, 'c')])
+
+            with self.assertRaises(DuplicateKey):
+                data.append((2, 'd'))
+            with self.assertRaises(DuplicateKey):
+                data.extend([(5, 'e'), (5, 'f')])
+            self.assertEqual(data.height, 3)
+
+            data.insert(1, (6, 'a'))
+            data.upsert((2, 'z'), key='id')
+            data.upsert((7, 'z'), key='id')
+            self.assertEqual(data.lookup('name', 'z'), [(2, 'z'), (7, 'z')])
+            self.assertEqual(data.lookup(1, 'a'), [(6, 'a'), (3, 'a')])
+            self.assertEqual(data['id'], [1, 6, 2, 3, 7])
+
+            data.sort('id', inplace=True)
+            self.assertEqual(data.lookup('id', 6), [(6, 'a')])
+            data.drop_index('id')
+            data.append((6, 'b'))
+            self.assertEqual(len(data.lookup('id', 6)), 2)
+
     def test_remove_duplicates(self):
         """Unique Rows."""
 
@@ -575,6 +767,33 @@ class TablibTestCase(BaseTestCase):
         self.assertEqual(self.founders[2], self.tom)
         self.assertEqual(self.founders.height, 3)
 
+    def test_remove_duplicates_keys(self):
+        """Rows are compared on the given columns, keeping first or last."""
+        data = tablib.Dataset(headers=['id', 'payload'])
+        data.append((1, {'a': [1]}), tags=['old'])
+        data.append((2, ['x']))
+        data.append((1, {'a': [2]}), tags=['new'])
+        data.append((2, ['x']))
+
+        last = data.filter(['old', 'new'])
+        last.remove_duplicates(keys=['id'], keep='last')
+        self.assertEqual(last[:], [(1, {'a': [2]})])
+        self.assertEqual(last.filter('new').height, 1)
+
+        data.remove_duplicates()
+        self.assertEqual(data['id'], [1, 2, 1])
+        data.remove_duplicates(keys=[0])
+        self.assertEqual(data['payload'], [{'a': [1]}, ['x']])
+
+        with self.assertRaises(ValueError):
+            data.remove_duplicates(keep='none')
+
+    def test_unique_rows(self):
+        rows = iter([[1, 'a'], [2, 'a'], [1, 'a'], [3, ['b']], [3, ['b']]])
+        self.assertEqual(list(tablib.unique_rows(rows)), [[1, 'a'], [2, 'a'], [3, ['b']]])
+        events = [{'id': 1, 'v': 1}, {'id': 1, 'v': 2}, {'id': 2, 'v': 3}]
+        self.assertEqual([e['v'] for e in tablib.unique_rows(events, keys=['id'])], [1, 3])
+
     def test_wipe(self):
         """Purge a dataset."""
 
@@ -610,6 +829,96 @@ class TablibTestCase(BaseTestCase):
         self.assertEqual(subset._data[0].list, ['John', 90])
         self.assertEqual(subset._data[1].list, ['Thomas', 50])
 
+    def test_views_copy_on_write(self):
+        """filter, subset and stack read the parent rows until a side is modified."""
+        self.founders.append(('Abigail', 'Adams', 99), tags=['adams'])
+        filtered = self.founders.filter('adams')
+        subset = self.founders.subset(rows=[0, 3], cols=['gpa'])
+        self.assertIs(filtered._data[0], self.founders._data[3])
+
+        filtered.append(('John Quincy', 'Adams', 80))
+        self.assertEqual(self.founders.height, 4)
+        self.assertEqual(filtered['first_name'], ['Abigail', 'John Quincy'])
+
+        self.founders[3] = ('Martha', 'Washington', 85)
+        del self.founders['first_name']
+        self.assertEqual(subset[:], [(90,), (99,)])
+        self.assertEqual(filtered[0], ('Abigail', 'Adams', 99))
+        self.assertEqual(filtered.filter('adams')[0], ('Abigail', 'Adams', 99))
+
+    def test_views_nested_and_stacked(self):
+        stacked = self.founders.stack(self.founders.filter('none'))
+        view = stacked.subset(rows=[1, 2], cols=['last_name'])
+        self.assertEqual(view.export('csv'), 'last_name\r\nWashington\r\nJefferson\r\n')
+
+        self.founders.wipe()
+        self.assertEqual(stacked.height, 3)
+        self.assertEqual(view['last_name'], ['Washington', 'Jefferson'])
+        self.assertEqual(pickle.loads(pickle.dumps(view))[:], [('Washington',), ('Jefferson',)])
+
+    def test_subset_rows_selectors(self):
+        """subset accepts slices, boolean masks and unordered indexes."""
+        self.assertEqual(self.founders.subset(rows=slice(1, None))['first_name'],
+                         ['George', 'Thomas'])
+        self.assertEqual(self.founders.subset(rows=[True, False, True])['gpa'], [90, 50])
+        self.assertEqual(self.founders.subset(rows=iter([2, 0, 2, 7, -1]))['gpa'], [90, 50])
+        self.assertEqual(self.founders.subset(cols=['gpa', 'unknown']).headers, ['gpa'])
+        with self.assertRaises(tablib.InvalidDimensions):
+            self.founders.subset(rows=[True, False])
+
+    def test_filter_tag_queries(self):
+        """filter answers OR, AND and NOT tag queries, following row changes."""
+        students = tablib.Dataset(headers=['first', 'last'])
+        students.rpush(['Kenneth', 'Reitz'], tags=['male', 'technical'])
+        students.rpush(['Daniel', 'Dupont'], tags=['male', 'creative'])
+        self.assertEqual(students.filter('male').height, 2)
+
+        students.rpush(['Bessie', 'Monke'], tags=['female', 'creative'])
+        students.extend([['Ada', 'Lovelace']], tags=['female', 'technical'])
+        self.assertEqual(students.filter(['female', 'technical'])['first'],
+                         ['Kenneth', 'Bessie', 'Ada'])
+        self.assertEqual(students.filter(['female', 'technical'], match_all=True)['first'],
+                         ['Ada'])
+        self.assertEqual(students.filter('creative', exclude='male')['first'], ['Bessie'])
+        self.assertEqual(students.filter(exclude=['creative'])['first'], ['Kenneth', 'Ada'])
+        self.assertEqual(students.filter(None).height, 0)
+
+        students.pop()
+        self.assertEqual(students.filter('technical')['first'], ['Kenneth'])
+        students.lpop()
+        students.lpush(['Grace', 'Hopper'], tags=['technical'])
+        self.assertEqual(students.filter('technical')['first'], ['Grace'])
+        self.assertEqual(students.filter('creative')['first'], ['Daniel', 'Bessie'])
+
+    def test_iteration(self):
+        """Datasets can be iterated over as tuples, lists, dicts or named tuples."""
+        self.founders.add_formatter('gpa', str)
+        self.assertEqual(list(self.founders), [self.john, self.george, self.tom])
+        self.assertEqual(next(self.founders.iterrows()), ['John', 'Adams', '90'])
+        self.assertEqual(
+            next(self.founders.iterdicts()),
+            {'first_name': 'John', 'last_name': 'Adams', 'gpa': '90'},
+        )
+        founder = next(self.founders.itertuples(name='Founder'))
+        self.assertEqual((founder.first_name, founder.gpa), ('John', '90'))
+        self.assertEqual(type(founder).__name__, 'Founder')
+        self.assertEqual(next(self.founders.itertuples(name=None)), ('John', 'Adams', '90'))
+
+        data.append((1, 2))
+        self.assertEqual(list(data.iterdicts()), [[1, 2]])
+        self.assertEqual(next(data.itertuples())._1, 2)
+
+    def test_iter_chunks(self):
+        self.founders.add_formatter('gpa', str)
+        chunks = list(self.founders.iter_chunks(2))
+        self.assertEqual([chunk.height for chunk in chunks], [2, 1])
+        self.assertEqual(chunks[1].dict, [dict(zip(self.headers, ('Thomas', 'Jefferson', '50')))])
+        self.founders.append(('Old', 'Man', 100500))
+        self.assertEqual(chunks[1].height, 1)
+        self.assertEqual(list(tablib.Dataset().iter_chunks(10)), [])
+        with self.assertRaises(ValueError):
+            next(self.founders.iter_chunks(0))
+
     def test_formatters(self):
         """Confirm formatters are being triggered."""
 
@@ -643,6 +952,45 @@ class TablibTestCase(BaseTestCase):
             {'first_name': 'THOMAS', 'last_name': 'JEFFERSON', 'gpa': '50'},
         ])
 
+    def test_formatters_chained(self):
+        """Formatters on the same column apply in the order they were added."""
+        self.founders.add_formatter(-1, lambda gpa: gpa + 1)
+        self.founders.add_formatter(None, str)
+        self.founders.add_formatter('gpa', lambda gpa: gpa * 2)
+
+        self.assertEqual(self.founders.dict[0], {
+            'first_name': 'John', 'last_name': 'Adams', 'gpa': '9191',
+        })
+        self.assertEqual(self.founders[0], self.john)
+
+    def test_formatters_cache(self):
+        calls = []
+
+        def _formatter(cell_value):
+            calls.append(cell_value)
+            return cell_value * 2
+
+        self.founders.cache_formatted = True
+        self.founders.add_formatter('gpa', _formatter)
+        csv = self.founders.export('csv')
+        self.assertEqual(self.founders.export('csv'), csv)
+        self.assertEqual(self.founders.dict[0]['gpa'], 180)
+        self.assertEqual(len(calls), 3)
+
+        self.founders.append(('Old', 'Man', 10))
+        self.assertEqual(self.founders['gpa'], [90, 67, 50, 10])
+        self.assertEqual(self.founders.dict[-1]['gpa'], 20)
+        self.assertEqual(len(calls), 7)
+
+    def test_formatters_empty_dataset(self):
+        for storage in ('rows', 'columnar'):
+            empty = tablib.Dataset(headers=['a', 'b'], storage=storage)
+            empty.add_formatter('a', str.upper)
+            self.assertEqual(empty.export('csv'), 'a,b\r\n')
+            self.assertEqual(empty.dict, [])
+            empty.cache_formatted = True
+            self.assertEqual(empty.export('json'), '[]')
+
     def test_unicode_renders_markdown_table(self):
         # add another entry to test right field width for
         # integer
@@ -654,6 +1002,29 @@ class TablibTestCase(BaseTestCase):
         founders = pickle.loads(pickle.dumps(self.founders))
         self.assertEqual(founders.export('json'), before_pickle)
 
+    def test_pickle_unpickle_tags_and_databook(self):
+        self.founders.append(('Old', 'Man', 100500), tags=['old'])
+        self.founders.create_index('gpa', unique=True)
+        book = pickle.loads(pickle.dumps(tablib.Databook([self.founders, tablib.Dataset()])))
+        founders, empty = book.sheets()
+        self.assertEqual(founders.storage, 'rows')
+        self.assertEqual(founders.filter('old')[:], [('Old', 'Man', 100500)])
+        self.assertEqual(founders.lookup('gpa', 90), [self.john])
+        self.assertEqual(founders.title, self.founders.title)
+        self.assertEqual(empty.height, 0)
+
+    def test_unpickle_legacy_dataset(self):
+        # Pickled before datasets were pickled as column blocks.
+        pickle_source = Path(__file__).parent / 'files' / 'legacy_dataset.pickle'
+        legacy = pickle.loads(pickle_source.read_bytes())
+        self.assertEqual(legacy.storage, 'rows')
+        self.assertEqual(legacy['gpa'], [90, 67])
+        self.assertEqual(legacy.filter('old').dict, [{'first_name': 'JOHN', 'gpa': 90}])
+        legacy.append(('Thomas', 50))
+        self.assertEqual(
+            legacy.export('csv'), 'first_name,gpa\r\nJOHN,90\r\nGEORGE,67\r\nTHOMAS,50\r\n'
+        )
+
     def test_databook_add_sheet_accepts_only_dataset_instances(self):
         class NotDataset:
             def append(self, item):
@@ -757,6 +1128,170 @@ class TablibTestCase(BaseTestCase):
         self.assertTrue(john.has_tag(["tag2", "tag1"]))
 
 
+class ColumnarStorageTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.columnar = tablib.Dataset(
+            self.john, self.george, self.tom, headers=self.headers, title='Founders',
+            storage='columnar',
+        )
+
+    def test_unknown_storage(self):
+        with self.assertRaises(ValueError):
+            tablib.Dataset(storage='unknown')
+
+    def test_columnar_rows_and_columns(self):
+        self.assertEqual(self.columnar.storage, 'columnar')
+        self.assertEqual(self.columnar.height, 3)
+        self.assertEqual(self.columnar.width, 3)
+        self.assertEqual(self.columnar[1], self.george)
+        self.assertEqual(self.columnar[1:], [self.george, self.tom])
+        self.assertEqual(self.columnar['gpa'], [90, 67, 50])
+        self.assertEqual(self.columnar.get_col(0), ['John', 'George', 'Thomas'])
+
+    def test_columnar_mutations(self):
+        self.columnar.insert(0, ('Abigail', 'Adams', 99), tags=['first'])
+        self.columnar.append_col([1, 2, 3, 4], header='rank')
+        del self.columnar['last_name']
+        del self.columnar[1]
+        self.columnar[0] = ('Abby', 95, 0)
+
+        self.assertEqual(self.columnar.headers, ['first_name', 'gpa', 'rank'])
+        self.assertEqual(self.columnar[:], [('Abby', 95, 0), ('George', 67, 3), ('Thomas', 50, 4)])
+        self.assertEqual(self.columnar.lpop(), ('Abby', 95, 0))
+        self.assertEqual(self.columnar.storage, 'columnar')
+
+    def test_columnar_exports_match_rows(self):
+        for format_ in ('csv', 'json', 'yaml', 'html', 'rst', 'latex'):
+            self.assertEqual(self.columnar.export(format_), self.founders.export(format_))
+        self.columnar.add_formatter('gpa', str)
+        self.assertEqual(self.columnar.dict[0]['gpa'], '90')
+
+    def test_columnar_derived_datasets_keep_storage(self):
+        self.assertEqual(self.columnar.sort('gpa').storage, 'columnar')
+        self.assertEqual(self.columnar.stack(self.founders)['gpa'], [90, 67, 50] * 2)
+        self.assertEqual(self.columnar.transpose().storage, 'columnar')
+        self.assertEqual(self.columnar.subset(rows=[0], cols=['gpa'])[:], [(90,)])
+        self.columnar.wipe()
+        self.assertEqual(self.columnar.storage, 'columnar')
+        self.assertEqual(self.columnar.height, 0)
+
+    def test_columnar_filter_keeps_tags(self):
+        data = tablib.Dataset(storage='columnar')
+        data.append(('a', 1), tags=['x'])
+        data.append(('b', 2), tags=['y'])
+        self.assertEqual(data.filter('y')[:], [('b', 2)])
+
+    def test_columnar_headers_without_rows(self):
+        data = tablib.Dataset(headers=['a', 'b'], storage='columnar')
+        self.assertEqual(data['a'], [])
+        self.assertEqual(data.sort('a')[:], [])
+        self.assertEqual(data.lookup('a', 1), [])
+        data.create_index('a')
+        del data['a']
+        self.assertEqual(data.headers, ['b'])
+        data.append((1,))
+        self.assertEqual(data['b'], [1])
+
+        # Emptied datasets take rows of any width, as with rows storage.
+        data = tablib.Dataset(('a', 1), storage='columnar')
+        del data[0]
+        data.append(('a', 1, True))
+        self.assertEqual(data[:], [('a', 1, True)])
+
+    def test_columnar_pickle(self):
+        columnar = pickle.loads(pickle.dumps(self.columnar))
+        self.assertEqual(columnar.storage, 'columnar')
+        self.assertEqual(columnar.export('json'), self.founders.export('json'))
+
+    def test_typed_columns(self):
+        rows = [(1, 1.5, True, 'a'), (2, 2.5, False, 'b')]
+        data = tablib.Dataset(*rows, headers=['id', 'price', 'sold', 'name'])
+        plain = tablib.Dataset(*rows, headers=['id', 'price', 'sold', 'name'])
+        data.set_schema()
+        self.assertEqual(data.storage, 'columnar')
+        self.assertEqual(data.schema, {'id': int, 'price': float, 'sold': bool})
+        self.assertEqual(data[0], (1, 1.5, True, 'a'))
+        self.assertIs(data['sold'][1], False)
+        self.assertEqual(data.sort('id', reverse=True).schema, data.schema)
+        self.assertEqual(data.subset(cols=['sold']).schema, {'sold': bool})
+        self.assertEqual(data.export('json'), plain.export('json'))
+
+        # Other values turn a typed column back into a list.
+        data.append((3, None, 1, 'c'))
+        self.assertEqual(data.schema, {'id': int})
+        self.assertEqual(data[-1], (3, None, 1, 'c'))
+
+        with self.assertRaises(TypeError):
+            data.set_schema({'name': int})
+        data.set_schema({'id': None})
+        self.assertEqual(data.schema, {})
+
+    def test_typed_columns_pickle_out_of_band(self):
+        data = tablib.Dataset(headers=['id', 'price', 'country', 'name'])
+        data.extend([(i, i / 2, 'fr' if i % 3 else 'de', str(i)) for i in range(1000)])
+        data.set_schema()
+        buffers = []
+        dumped = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 3)
+        self.assertLess(len(dumped), 20000)
+        loaded = pickle.loads(dumped, buffers=buffers)
+        self.assertEqual(loaded.schema, data.schema)
+        self.assertEqual(loaded.dict, data.dict)
+        del buffers
+
+        loaded.append((1000, 0.0, 'es', 'x'))
+        loaded = pickle.loads(pickle.dumps(loaded, protocol=4))
+        self.assertEqual(loaded[-1], (1000, 0.0, 'es', 'x'))
+
+    def test_copy(self):
+        for storage in tablib.core.STORAGES:
+            data = tablib.Dataset(('a', 1), headers=['name', 'n'], storage=storage)
+            data.append(('b', 2), tags=['b'])
+            copied = copy.copy(data)
+            copied.append(('c', 3))
+            copied[0] = ('z', 0)
+            self.assertEqual(data.height, 2)
+            self.assertEqual(data[:], [('a', 1), ('b', 2)])
+            self.assertEqual(copied[:], [('z', 0), ('b', 2), ('c', 3)])
+            self.assertEqual(copied.filter('b')[:], [('b', 2)])
+
+    def test_typed_columns_declared(self):
+        data = tablib.Dataset(headers=['id', 'ok'], schema={'id': int, 'ok': bool})
+        data.append((1, True))
+        data.extend([(2, False), (3, True)])
+        self.assertEqual(data.schema, {'id': int, 'ok': bool})
+        self.assertEqual(data['ok'], [True, False, True])
+        data = pickle.loads(pickle.dumps(data))
+        self.assertEqual(data.schema, {'id': int, 'ok': bool})
+
+        loaded = tablib.Dataset().load(data.json, 'json', schema='infer')
+        self.assertEqual(loaded.schema, data.schema)
+
+    def test_categorical_columns(self):
+        data = tablib.Dataset(headers=['country', 'amount'])
+        data.extend([('fr', 1), ('fr', 2), ('de', 3), ('fr', 4)])
+        plain = data.json
+        data.set_schema()
+        self.assertEqual(data.schema, {'country': 'category', 'amount': int})
+        self.assertEqual(data['country'], ['fr', 'fr', 'de', 'fr'])
+        self.assertEqual(data[2], ('de', 3))
+        self.assertEqual(data.json, plain)
+        self.assertEqual(data.sort('country').schema, data.schema)
+
+        data.set_schema({'amount': 'category'})
+        data.append((True, 1))
+        data.append((1, True))
+        self.assertEqual(data['amount'][-2:], [1, True])
+        data.append((['unhashable'], 5))
+        self.assertEqual(data.schema, {'amount': 'category'})
+        self.assertEqual(data['country'][-3:], [True, 1, ['unhashable']])
+
+        loaded = tablib.Dataset().load(plain, 'json', schema={'country': 'category'})
+        self.assertEqual(loaded.schema, {'country': 'category'})
+        self.assertEqual(loaded.dict, data.dict[:4])
+
+
 class HTMLTests(BaseTestCase):
     founders_html = (
         "<table>"
@@ -911,6 +1446,178 @@ class RSTTests(BaseTestCase):
 
 
 class CSVTests(BaseTestCase):
+    def test_csv_iter_import(self):
+        _csv = self.founders.csv
+        chunks = list(tablib.iter_import(_csv, 'csv', chunk_size=2))
+        self.assertEqual([chunk.height for chunk in chunks], [2, 1])
+        self.assertEqual(chunks[0].headers, list(self.headers))
+        self.assertEqual(chunks[1][:], [('Thomas', 'Jefferson', '50')])
+
+        chunks = list(tablib.iter_import(StringIO(_csv), chunk_size=10, headers=False))
+        self.assertEqual(chunks[0].headers, None)
+        self.assertEqual(chunks[0][0], tuple(self.headers))
+
+        with self.assertRaises(UnsupportedFormat):
+            next(tablib.iter_import(self.founders.html, 'html'))
+
+    def test_csv_iter_rows(self):
+        _csv = self.founders.csv + 'Ben\r\n'
+        rows = list(tablib.iter_rows(_csv, 'csv'))
+        self.assertEqual(rows[0], list(self.headers))
+        self.assertEqual(rows[-1], ['Ben', '', ''])
+
+        rows = list(tablib.iter_rows(self.founders.csv, row_type=dict))
+        self.assertEqual(rows[0], {'first_name': 'John', 'last_name': 'Adams', 'gpa': '90'})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'founders.csv'
+            path.write_text(self.founders.csv, newline='')
+            rows = list(tablib.iter_rows(path, row_type=namedtuple))
+        self.assertEqual(rows[1].last_name, 'Washington')
+        self.assertEqual(rows[-1], ('Thomas', 'Jefferson', '50'))
+
+        rows = list(tablib.iter_rows(_csv, 'csv', headers=False, row_type=tuple))
+        self.assertEqual(rows[0], tuple(self.headers))
+        with self.assertRaises(HeadersNeeded):
+            tablib.iter_rows(_csv, 'csv', headers=False, row_type=dict)
+        with self.assertRaises(ValueError):
+            tablib.iter_rows(_csv, 'csv', row_type=set)
+
+    def test_csv_import_set_workers(self):
+        rows = [['1', 'plain'], ['2', 'quoted "", and\nnew line'], ['4', 'é']] * 50
+        _csv = 'skipped\r\na,b\r\n' + tablib.Dataset(*rows).csv + '\r\n3\r\n'
+        expected = tablib.Dataset().load(_csv, 'csv', skip_lines=1)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'data.csv'
+            path.write_text(_csv, newline='', encoding='utf-8')
+            with path.open(newline='', encoding='utf-8') as fh:
+                data = tablib.Dataset().load(fh, 'csv', skip_lines=1, workers=3)
+        self.assertEqual(data.headers, ['a', 'b'])
+        self.assertEqual(data[:], expected[:])
+        self.assertEqual(data[-1], ('3', ''))
+
+        # Streams which aren't files on disk are parsed in a single process.
+        data = tablib.Dataset().load(StringIO(_csv), 'csv', skip_lines=1, workers=3)
+        self.assertEqual(data[:], expected[:])
+
+    def test_csv_import_set_workers_stream(self):
+        """Files are read from their position, with their newline translation."""
+        _csv = 'a,b\r\n' + '1,"x\r\ny"\r\n2,"z\rw"\r\n' * 150
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'data.csv'
+            path.write_text(_csv, newline='', encoding='utf-8')
+            for newline in (None, ''):
+                with path.open(newline=newline, encoding='utf-8') as fh:
+                    expected = tablib.Dataset().load(fh, 'csv')
+                with path.open(newline=newline, encoding='utf-8') as fh:
+                    data = tablib.Dataset().load(fh, 'csv', workers=4)
+                self.assertEqual(data[0], ('1', 'x\ny' if newline is None else 'x\r\ny'))
+                self.assertEqual(data[:], expected[:])
+
+            with path.open(newline='', encoding='utf-8') as fh:
+                fh.readline()
+                data = tablib.Dataset().load(fh, 'csv', headers=False, workers=2)
+        self.assertEqual(data.height, 300)
+        self.assertEqual(data[0], ('1', 'x\r\ny'))
+
+    def test_csv_import_set_workers_stray_quote(self):
+        """A quote within an unquoted value doesn't throw the split off."""
+        records = '1,12" pipe\r\n2,"quoted\r\nvalue"\r\n3,plain\r\n' * 67
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'data.csv'
+            for _csv in ('a,b\r\n' + records, 'a,b"\r\n' + records, records + 'x,"\r\n'):
+                path.write_text(_csv, newline='', encoding='utf-8')
+                expected = tablib.Dataset().load(_csv, 'csv')
+                with path.open(newline='', encoding='utf-8') as fh:
+                    data = tablib.Dataset().load(fh, 'csv', workers=4)
+                self.assertEqual(data.headers, expected.headers)
+                self.assertEqual(data[:], expected[:])
+
+    def test_csv_import_set_infer_types(self):
+        _csv = (
+            'id,zip,price,paid,day,at,note\r\n'
+            '1,007,2.5,true,2024-01-02,2024-01-02 10:00,a\r\n'
+            '2,010,,False,2024-13-01,2024-01-02T11:30:00,b\r\n'
+        )
+        data = tablib.Dataset().load(_csv, 'csv', infer_types=True)
+        self.assertEqual(data[0], (
+            1, '007', 2.5, True, dt.date(2024, 1, 2), dt.datetime(2024, 1, 2, 10), 'a',
+        ))
+        # Empty values become None, values which can't be converted are kept.
+        self.assertEqual(data[1][2:5], (None, False, '2024-13-01'))
+
+        with mock.patch.object(tablib.formats._csv.CSVFormat, 'INFER_SAMPLE_SIZE', 1):
+            data = tablib.Dataset().load(_csv + '3.5,1,1,1,1,1,1\r\n', 'csv', infer_types=True)
+        self.assertEqual(data['id'], [1, 2, '3.5'])
+
+        data = tablib.Dataset().load(
+            _csv, 'csv', infer_types=True, dtypes={'id': str, 'price': Decimal, 1: int}
+        )
+        self.assertEqual(data[0][:3], ('1', 7, Decimal('2.5')))
+        self.assertEqual(data['paid'], [True, False])
+
+    def test_csv_import_set_select(self):
+        stream = StringIO(self.founders.csv + 'Ben,Franklin,80\r\n' * 1000)
+        data = tablib.Dataset().load(stream, 'csv', usecols=['gpa', 0], nrows=2, skiprows=1)
+        self.assertEqual(data.headers, ['gpa', 'first_name'])
+        self.assertEqual(data[:], [('67', 'George'), ('50', 'Thomas')])
+        # Reading stopped after the last row kept.
+        self.assertLess(stream.tell(), len(stream.getvalue()))
+
+        data = tablib.Dataset().load(self.founders.csv, 'csv', skiprows={0, 2}, usecols=[1])
+        self.assertEqual(data[:], [('Washington',)])
+
+        with self.assertRaises(KeyError):
+            tablib.Dataset().load(self.founders.csv, 'csv', usecols=['age'])
+        with self.assertRaises(HeadersNeeded):
+            tablib.Dataset().load(self.founders.csv, 'csv', headers=False, usecols=['gpa'])
+
+    def test_csv_import_set_where(self):
+        _csv = self.founders.csv + 'Ben,Franklin,80\r\n'
+        data = tablib.Dataset().load(
+            _csv, 'csv', where=lambda row: row['gpa'] > '60', usecols=['first_name'], nrows=2
+        )
+        self.assertEqual(data[:], [('John',), ('George',)])
+
+        data = tablib.Dataset().load(_csv, 'csv', where={'last_name': 'Franklin', 2: '80'})
+        self.assertEqual(data[:], [('Ben', 'Franklin', '80')])
+
+        data = tablib.Dataset().load(_csv, 'csv', headers=False, where=lambda row: row[0] < 'C')
+        self.assertEqual(data[:], [('Ben', 'Franklin', '80')])
+
+        with self.assertRaises(TypeError):
+            tablib.Dataset().load(_csv, 'csv', where="gpa > '60'")
+
+    def test_csv_export_to_stream(self):
+        self.founders.add_formatter('gpa', lambda gpa: gpa / 10)
+        expected = self.founders.export('csv')
+
+        stream = StringIO()
+        self.assertIsNone(self.founders.export('csv', stream=stream))
+        self.assertEqual(stream.getvalue(), expected)
+
+        stream = BytesIO()
+        self.founders.append(('Zoë', 'Ünicode', 0))
+        with mock.patch.object(tablib.formats._csv.CSVFormat, 'BATCH_SIZE', 2):
+            self.founders.export('csv', stream=stream, encoding='utf-16')
+        self.assertEqual(stream.getvalue().decode('utf-16'), self.founders.export('csv'))
+
+        # Streams which aren't io.TextIOBase instances are binary unless their
+        # mode says otherwise.
+        with tempfile.SpooledTemporaryFile(mode='w+b') as stream:
+            self.founders.export('csv', stream=stream)
+            stream.seek(0)
+            self.assertEqual(stream.read().decode('utf-8'), self.founders.export('csv'))
+        with tempfile.SpooledTemporaryFile(mode='w+', newline='') as stream:
+            self.founders.export('csv', stream=stream)
+            stream.seek(0)
+            self.assertEqual(stream.read(), self.founders.export('csv'))
+
+        stream = StringIO()
+        tablib.Dataset().export('tsv', stream=stream)
+        self.assertEqual(stream.getvalue(), '')
+
     def test_csv_format_detect(self):
         """Test CSV format detection."""
 
@@ -1304,6 +2011,17 @@ class ODSTests(BaseTestCase):
         new_data = tablib.Dataset().load(_ods, skip_lines=2)
         self.assertEqual(new_data.headers, ['id', 'name', 'description'])
 
+    def test_ods_import_set_select(self):
+        new_data = tablib.Dataset().load(
+            self.founders.ods, 'ods', usecols=['last_name'], nrows=1, skiprows=1
+        )
+        self.assertEqual(new_data.headers, ['last_name'])
+        self.assertEqual(new_data[:], [('Washington',)])
+
+    def test_ods_import_set_where(self):
+        new_data = tablib.Dataset().load(self.founders.ods, 'ods', where={'first_name': 'John'})
+        self.assertEqual(new_data[:], [('John', 'Adams', 90)])
+
     def test_ods_import_set_ragged(self):
         ods_source = Path(__file__).parent / 'files' / 'ragged.ods'
         with ods_source.open('rb') as fh:
@@ -1359,6 +2077,10 @@ class XLSTests(BaseTestCase):
         new_data = tablib.Dataset().load(_xls, skip_lines=2)
         self.assertEqual(new_data.headers, ['id', 'name', 'description'])
 
+    def test_xls_import_set_where(self):
+        new_data = tablib.Dataset().load(self.founders.xls, 'xls', where={'gpa': 67})
+        self.assertEqual(new_data[:], [('George', 'Washington', 67)])
+
     def test_xls_import_with_errors(self):
         """Errors from imported files are kept as errors."""
         xls_source = Path(__file__).parent / 'files' / 'errors.xls'
@@ -1476,6 +2198,28 @@ class XLSXTests(BaseTestCase):
         new_data = tablib.Dataset().load(_xlsx, skip_lines=2)
         self.assertEqual(new_data.headers, ['id', 'name', 'description'])
 
+    def test_xlsx_import_set_select(self):
+        new_data = tablib.Dataset().load(
+            self.founders.xlsx, 'xlsx', usecols=['gpa', 'first_name'], nrows=2
+        )
+        self.assertEqual(new_data.headers, ['gpa', 'first_name'])
+        self.assertEqual(new_data[:], [(90, 'John'), (67, 'George')])
+
+    def test_xlsx_import_set_where(self):
+        new_data = tablib.Dataset().load(
+            self.founders.xlsx, 'xlsx', where=lambda row: row['last_name'].startswith('J')
+        )
+        self.assertEqual(new_data[:], [self.tom])
+
+    def test_xlsx_iter_import(self):
+        xlsx_source = Path(__file__).parent / 'files' / 'ragged.xlsx'
+        with xlsx_source.open('rb') as fh:
+            chunks = list(tablib.iter_import(fh, 'xlsx', chunk_size=1))
+        with xlsx_source.open('rb') as fh:
+            dataset = tablib.Dataset().load(fh, 'xlsx')
+        self.assertEqual([chunk.headers for chunk in chunks], [dataset.headers] * dataset.height)
+        self.assertEqual([chunk[0] for chunk in chunks], dataset[:])
+
     def test_xlsx_bad_chars_sheet_name(self):
         """
         Sheet names are limited to 30 chars and the following chars
@@ -1652,6 +2396,78 @@ class XLSXTests(BaseTestCase):
             self._book_helper_export_column_width("invalid input")
 
 
+class TabbinTests(BaseTestCase):
+    def test_tabbin_export_import_set(self):
+        data = tablib.Dataset(headers=['id', 'price', 'ok', 'name', 'day', 'amount'], title='T')
+        data.extend([
+            (1, 1.5, True, 'a', dt.date(2020, 1, 1), Decimal('1.10')),
+            (2, 2.5, False, None, dt.datetime(2020, 1, 2, 3, 4), b'raw'),
+        ])
+        data.append((3, 3.5, True, 'c', dt.time(5, 6), None), tags=['last'])
+        data.add_formatter('name', lambda value: value and value.upper())
+
+        _tabbin = data.export('tabbin')
+        self.assertEqual(tablib.detect_format(_tabbin), 'tabbin')
+        loaded = tablib.Dataset().load(_tabbin, 'tabbin')
+        self.assertEqual(loaded.storage, 'columnar')
+        self.assertEqual(loaded.title, 'T')
+        self.assertEqual(loaded.dict, data.dict)
+        self.assertEqual(loaded.schema, {'id': int, 'price': float, 'ok': bool})
+        self.assertEqual(loaded.filter('last')['id'], [3])
+
+        data.append((4, 4.5, False, 'd', None, object()))
+        with self.assertRaises(TypeError):
+            data.export('tabbin')
+
+    def test_tabbin_container_values(self):
+        values = [
+            (1, 'a'),
+            [(2, 3), {'k': (4,)}],
+            {'$tablib': 'date', 'value': '2020-01-01'},
+            {1: 'one', (2, 3): [dt.date(2020, 1, 1)]},
+        ]
+        data = tablib.Dataset(*([value, 'x'] for value in values), headers=[('a', 'b'), 'c'])
+        data.append(((5, 6), 'y'), tags=[('t', 1)])
+        loaded = tablib.Dataset().load(data.tabbin, 'tabbin')
+        self.assertEqual(loaded.headers, data.headers)
+        self.assertEqual(loaded[:], data[:])
+        self.assertEqual(
+            [type(value) for value in loaded.get_col(0)], [tuple, list, dict, dict, tuple]
+        )
+        self.assertEqual(loaded.filter([('t', 1)])[:], [((5, 6), 'y')])
+
+    def test_tabbin_load_mapped_file(self):
+        self.founders.set_schema({'gpa': int, 'first_name': 'category'})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'founders.tabbin'
+            path.write_bytes(self.founders.tabbin)
+            loaded = tablib.Dataset().load(path, 'tabbin')
+            with path.open('rb') as fh:
+                self.assertEqual(tablib.Dataset().load(fh).dict, self.founders.dict)
+
+        # Columns are decoded on first access.
+        self.assertEqual(loaded['gpa'], [90, 67, 50])
+        self.assertEqual(loaded[2], ('Thomas', 'Jefferson', 50))
+        self.assertEqual(loaded.schema, self.founders.schema)
+        loaded.append(('John', 'Hancock', None))
+        self.assertEqual(loaded.height, 4)
+
+        with self.assertRaises(ValueError):
+            tablib.Dataset().load(b'not tabbin', 'tabbin')
+        with self.assertRaisesRegex(TypeError, 'binary'):
+            tablib.Dataset().load(str(path), 'tabbin')
+
+    def test_tabbin_headers_without_rows(self):
+        for storage in ('rows', 'columnar'):
+            data = tablib.Dataset(headers=['a', 'b'], storage=storage)
+            loaded = tablib.Dataset().load(data.tabbin, 'tabbin')
+            self.assertEqual(loaded.headers, ['a', 'b'])
+            self.assertEqual(loaded['a'], [])
+            self.assertEqual(len(loaded._data.columns), 2)
+            loaded.append((1, 2))
+            self.assertEqual(loaded[:], [(1, 2)])
+
+
 class JSONTests(BaseTestCase):
     def test_json_format_detect(self):
         """Test JSON format detection."""
@@ -1693,6 +2509,17 @@ class JSONTests(BaseTestCase):
 
         self.assertEqual(json.loads(_json), json.loads(data.json))
 
+    def test_json_import_set_where(self):
+        new_data = tablib.Dataset().load(
+            self.founders.json, 'json', where=lambda row: row['gpa'] < 60
+        )
+        self.assertEqual(new_data.headers, list(self.headers))
+        self.assertEqual(new_data[:], [self.tom])
+
+        new_data = tablib.Dataset().load(self.founders.json, 'json', where={'gpa': 0})
+        self.assertEqual(new_data.headers, list(self.headers))
+        self.assertEqual(new_data.height, 0)
+
     def test_json_export(self):
         """Verify exporting dataset object as JSON"""
 
@@ -1848,6 +2675,27 @@ class LatexTests(BaseTestCase):
         self.assertIn('textasciicircum', output)
 
 
+class JSONLinesTests(BaseTestCase):
+    def test_jsonl_export_import_set(self):
+        _jsonl = self.founders.export('jsonl')
+        self.assertEqual(
+            _jsonl.splitlines()[0], '{"first_name": "John", "last_name": "Adams", "gpa": 90}'
+        )
+        self.assertEqual(tablib.detect_format(_jsonl), 'jsonl')
+        self.assertEqual(tablib.Dataset().load(_jsonl, 'jsonl').dict, self.founders.dict)
+
+        data = tablib.Dataset().load('{"a": 1}\n\n{"b": 2, "a": 3}\n', 'jsonl')
+        self.assertEqual(data.dict, [{'a': 1}, {'a': 3}])
+        data = tablib.Dataset().load(b'[1, 2]\n[3, 4]\n', 'jsonl', headers=False)
+        self.assertEqual(data[:], [(1, 2), (3, 4)])
+
+    def test_jsonl_iter_import(self):
+        _jsonl = self.founders.export('jsonl')
+        chunks = list(tablib.iter_import(_jsonl, 'jsonl', chunk_size=2))
+        self.assertEqual([chunk.headers for chunk in chunks], [list(self.headers)] * 2)
+        self.assertEqual(chunks[1][:], [self.tom])
+
+
 class DBFTests(BaseTestCase):
     def test_dbf_import_set(self):
         data.append(self.john)
@@ -1871,6 +2719,26 @@ class DBFTests(BaseTestCase):
                     )
                 index += 1
 
+    def test_dbf_iter_import(self):
+        data.extend([self.john, self.george])
+        data.headers = self.headers
+        chunks = list(tablib.iter_import(data.dbf, 'dbf', chunk_size=1))
+        self.assertEqual([chunk.height for chunk in chunks], [1, 1])
+        self.assertEqual(chunks[1].dict, tablib.Dataset().load(data.dbf, 'dbf').dict[1:])
+
+    def test_dbf_import_set_select(self):
+        data.extend([self.john, self.george, self.tom])
+        data.headers = self.headers
+        new_data = tablib.Dataset().load(data.dbf, 'dbf', usecols=[2, 0], skiprows=[1])
+        self.assertEqual(new_data.headers, ['GPA', 'FIRST_NAME'])
+        self.assertEqual(new_data[:], [(90.0, 'John'), (50.0, 'Thomas')])
+
+    def test_dbf_import_set_where(self):
+        data.extend([self.john, self.george, self.tom])
+        data.headers = self.headers
+        new_data = tablib.Dataset().load(data.dbf, 'dbf', where={'GPA': 67})
+        self.assertEqual(new_data['FIRST_NAME'], ['George'])
+
     def test_dbf_export_set(self):
         """Test DBF import."""
         data.append(self.john)